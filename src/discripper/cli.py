@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import argparse
+import copy
 import logging
 import os
 import shlex
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Mapping, Sequence
 
-from .config import load_config
+from .config import load_config, merge_with_defaults
 from .core import (
     BluRayNotSupportedError,
     ClassificationResult,
@@ -51,7 +53,7 @@ EXIT_UNEXPECTED_ERROR = 3
 def _print_error(message: str) -> None:
     """Emit *message* to :data:`sys.stderr` with a standard prefix."""
 
-    print(f"Error: {message}", file=sys.stderr)
+    sys.stderr.write(f"Error: {message}\n")
 
 
 def _inspect_disc(device: str, tools: InspectionTools) -> DiscInfo:
@@ -120,10 +122,14 @@ def _compression_output_path(path: Path) -> Path:
     return path.with_name(f"{path.stem}-compressed{path.suffix}")
 
 
-def _handbrake_command(source: Path) -> tuple[str, ...]:
-    """Return the HandBrakeCLI command for compressing *source* into a new file."""
+def _handbrake_command(source: Path, destination: Path | None = None) -> tuple[str, ...]:
+    """Return the HandBrakeCLI command for compressing *source* into a new file.
 
-    destination = _compression_output_path(source)
+    *destination* defaults to :func:`_compression_output_path` of *source*.
+    """
+
+    if destination is None:
+        destination = _compression_output_path(source)
     return (
         "HandBrakeCLI",
         "-i",
@@ -138,13 +144,17 @@ def _handbrake_command(source: Path) -> tuple[str, ...]:
 def _emit_compression_plan(plan: RipPlan, *, executed: bool) -> None:
     """Log the HandBrake compression plan for *plan*'s destination."""
 
-    command = _handbrake_command(plan.destination)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    output = _compression_output_path(plan.destination)
+    command = _handbrake_command(plan.destination, output)
     status = "ready" if executed else "dry-run"
     logger.info(
         'EVENT=COMPRESS_PLAN STATUS=%s SOURCE="%s" OUTPUT="%s" COMMAND="%s"',
         status,
         plan.destination,
-        _compression_output_path(plan.destination),
+        output,
         shlex.join(command),
     )
 
@@ -292,11 +302,28 @@ def build_argument_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@lru_cache(maxsize=1)
+def _shared_argument_parser() -> argparse.ArgumentParser:
+    """Return a parser reused across :func:`parse_arguments` calls."""
+
+    return build_argument_parser()
+
+
+@lru_cache(maxsize=1)
+def _default_namespace() -> argparse.Namespace:
+    """Return the namespace produced by parsing an empty argument list."""
+
+    return _shared_argument_parser().parse_args([])
+
+
 def parse_arguments(argv: Sequence[str] | None = None) -> argparse.Namespace:
     """Parse CLI arguments from *argv* or :data:`sys.argv`."""
 
-    parser = build_argument_parser()
-    return parser.parse_args(argv)
+    if argv is not None and not argv:
+        # Deep copy so list-valued defaults cannot leak back into the cache.
+        return copy.deepcopy(_default_namespace())
+
+    return _shared_argument_parser().parse_args(argv)
 
 
 def _resolve_log_level(value: object) -> int:
@@ -344,10 +371,23 @@ def configure_logging(config: Mapping[str, Any]) -> None:
     )
 
 
-def resolve_cli_config(args: argparse.Namespace) -> dict[str, Any]:
-    """Return the effective configuration after applying CLI overrides."""
-
-    config = load_config(args.config_path)
+def resolve_cli_config(
+    args: argparse.Namespace,
+    *,
+    config_loader: Callable[[str | None], dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Return the effective configuration after applying CLI overrides.
+
+    *config_loader* replaces reading the file with :func:`load_config` when
+    provided, which lets callers supply an already-parsed configuration without
+    touching disk.  Its result is merged with the defaults and validated exactly
+    like a configuration file.
+    """
+
+    if config_loader is None:
+        config = load_config(args.config_path)
+    else:
+        config = merge_with_defaults(config_loader(args.config_path))
 
     title_source: str | None = None
     existing_title = config.get("title")
@@ -405,9 +445,8 @@ def _is_readable_device(path: object) -> bool:
     except Exception:  # pragma: no cover - defensive
         return False
 
-    if not candidate.exists():
-        return False
-
+    # ``os.access`` already reports missing paths as unreadable, so a separate
+    # existence check would only add a ``stat`` call.
     return os.access(candidate, os.R_OK)
 
 
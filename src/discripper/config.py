@@ -4,11 +4,10 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 CONFIG_PATH = Path("~/.config/discripper.yaml")
 DEFAULT_CONFIG: dict[str, Any] = {
     "output_directory": str(Path.home() / "Videos"),
@@ -66,13 +65,52 @@ CONFIG_SCHEMA: dict[str, Any] = {
     },
 }
 
-__all__ = ["CONFIG_PATH", "DEFAULT_CONFIG", "CONFIG_SCHEMA", "load_config"]
+__all__ = [
+    "CONFIG_PATH",
+    "DEFAULT_CONFIG",
+    "CONFIG_SCHEMA",
+    "clear_cache",
+    "clone_default_config",
+    "load_config",
+    "merge_with_defaults",
+]
+
+
+def clone_default_config() -> dict[str, Any]:
+    """Return a fresh, mutable copy of :data:`DEFAULT_CONFIG`."""
+
+    return _copy_mappings(DEFAULT_CONFIG)
+
+
+def clear_cache() -> None:
+    """Forget every parsed configuration file so the next load reads from disk."""
+
+    _load_config_file.cache_clear()
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return _copy_mappings(value)
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    return value
+
+
+def _copy_mappings(value: Mapping[str, Any]) -> dict[str, Any]:
+    """Return a copy of *value* with nested mappings and lists copied recursively.
+
+    *value* is either the defaults or, through :func:`_merge_config`, a section
+    that already holds user overrides.  Other values are scalars and are
+    shared, which avoids the overhead of :func:`copy.deepcopy`.
+    """
+
+    return {key: _copy_value(item) for key, item in value.items()}
 
 
 def _merge_config(base: Mapping[str, Any], overrides: Mapping[str, Any]) -> dict[str, Any]:
     """Return a deep-merged copy of *base* with values from *overrides*."""
 
-    merged: dict[str, Any] = deepcopy(dict(base))
+    merged = _copy_mappings(base)
     for key, value in overrides.items():
         if isinstance(value, Mapping) and isinstance(merged.get(key), Mapping):
             merged[key] = _merge_config(merged[key], value)
@@ -81,6 +119,20 @@ def _merge_config(base: Mapping[str, Any], overrides: Mapping[str, Any]) -> dict
     return merged
 
 
+def merge_with_defaults(overrides: Mapping[str, Any]) -> dict[str, Any]:
+    """Return *overrides* deep-merged over :data:`DEFAULT_CONFIG` and validated.
+
+    Raises
+    ------
+    ValueError
+        If the merged configuration does not match :data:`CONFIG_SCHEMA`.
+    """
+
+    merged = _merge_config(DEFAULT_CONFIG, overrides)
+    _validate_config(merged)
+    return merged
+
+
 def _ensure_type(value: Any, expected: Any, path: str) -> None:
     if isinstance(expected, tuple):
         if not isinstance(value, expected):
@@ -125,7 +177,7 @@ def _validate_config(config: Mapping[str, Any]) -> None:
 
 
 def _validated_defaults() -> dict[str, Any]:
-    defaults = deepcopy(DEFAULT_CONFIG)
+    defaults = clone_default_config()
     _validate_config(defaults)
     return defaults
 
@@ -151,20 +203,49 @@ def load_config(path: str | Path | None = None) -> dict[str, Any]:
 
     config_path = Path(path).expanduser() if path else CONFIG_PATH.expanduser()
 
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except OSError:
         return _validated_defaults()
 
-    raw_content = config_path.read_text(encoding="utf-8")
-    if not raw_content.strip():
+    cached = _load_config_file(config_path, stat.st_mtime_ns, stat.st_size)
+    if cached is None:
         return _validated_defaults()
+    return deepcopy(cached)
+
+
+def _parse_yaml(raw_content: bytes) -> Any:
+    """Parse *raw_content* with the fastest available PyYAML safe loader.
+
+    PyYAML is imported here rather than at module level so that runs without a
+    configuration file (and ``--help``) never pay for loading it.
+    """
+
+    import yaml
 
-    loaded = yaml.safe_load(raw_content)
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(raw_content, Loader=loader)
+
+
+@lru_cache(maxsize=8)
+def _load_config_file(config_path: Path, mtime_ns: int, size: int) -> dict[str, Any] | None:
+    """Parse and validate *config_path*, returning ``None`` when it is empty.
+
+    The modification time and size only form part of the cache key so that an
+    edited file is parsed again. Callers must copy the result before handing it
+    out because the cached mapping is shared.
+    """
+
+    # libyaml decodes UTF-8 (and honours a BOM) itself, so skip the str round-trip.
+    raw_content = config_path.read_bytes()
+    if not raw_content.strip():
+        return None
+
+    loaded = _parse_yaml(raw_content)
     if loaded is None:
-        return _validated_defaults()
+        return None
 
     if not isinstance(loaded, Mapping):
         raise ValueError("Configuration file must define a mapping")
 
-    merged = _merge_config(DEFAULT_CONFIG, loaded)
-    _validate_config(merged)
-    return merged
+    return merge_with_defaults(loaded)
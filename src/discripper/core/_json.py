@@ -0,0 +1,23 @@
+"""JSON helpers that use :mod:`orjson` when the optional ``fast`` extra is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Mapping
+
+try:  # pragma: no cover - depends on the optional "fast" extra
+    from orjson import OPT_APPEND_NEWLINE, OPT_INDENT_2, dumps as _orjson_dumps
+    from orjson import loads
+except ImportError:  # pragma: no cover - standard-library fallback
+    _orjson_dumps = None
+    from json import loads
+
+__all__ = ["dumps_indented", "loads"]
+
+
+def dumps_indented(document: Mapping[str, object]) -> bytes:
+    """Return *document* as two-space indented UTF-8 JSON ending in a newline."""
+
+    if _orjson_dumps is not None:  # pragma: no cover - depends on the optional "fast" extra
+        return _orjson_dumps(document, option=OPT_INDENT_2 | OPT_APPEND_NEWLINE)
+    return (json.dumps(document, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
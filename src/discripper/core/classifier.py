@@ -6,7 +6,7 @@ import logging
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import TYPE_CHECKING, Literal, Sequence, Tuple
+from typing import TYPE_CHECKING, Iterable, Literal, Sequence, Tuple
 
 if TYPE_CHECKING:  # pragma: no cover - for typing only
     from . import DiscInfo, TitleInfo
@@ -59,13 +59,11 @@ def classify_disc(
     """
 
     active_thresholds = thresholds or DEFAULT_THRESHOLDS
-    titles = list(disc.titles)
+    titles = disc.titles
     if not titles:
         return ClassificationResult("movie", ())
 
-    episode_candidates = _series_candidates(
-        list(enumerate(titles)), active_thresholds
-    )
+    episode_candidates = _series_candidates(enumerate(titles), active_thresholds)
     if episode_candidates:
         ordered = tuple(title for _, title in episode_candidates)
         codes = tuple(f"s01e{index + 1:02d}" for index in range(len(ordered)))
@@ -110,7 +108,7 @@ def _is_movie_candidate(
 
 
 def _series_candidates(
-    indexed_titles: Sequence[tuple[int, TitleInfo]],
+    indexed_titles: Iterable[tuple[int, TitleInfo]],
     thresholds: ClassificationThresholds,
 ) -> Tuple[tuple[int, TitleInfo], ...]:
     filtered = [
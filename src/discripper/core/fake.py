@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import json
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Mapping, Optional, Sequence, TYPE_CHECKING
 
+from ._json import loads as _json_loads
+
 if TYPE_CHECKING:  # pragma: no cover - imported for typing only
     from . import DiscInfo, TitleInfo
 
@@ -30,18 +33,32 @@ def inspect_from_fixture(
     if not path.is_absolute():
         path = base_dir / path
 
-    payload = _load_payload(path)
-    return _disc_from_payload(payload)
+    try:
+        stat = path.stat()
+    except FileNotFoundError as exc:  # pragma: no cover - defensive
+        raise FileNotFoundError(f"Fixture not found: {path}") from exc
+
+    return _load_disc(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _load_disc(path: Path, mtime_ns: int, size: int) -> DiscInfo:
+    """Parse the fixture at *path*; the stat fields key the cache on file changes.
+
+    The returned :class:`DiscInfo` is frozen, so cached instances can be shared.
+    """
+
+    return _disc_from_payload(_load_payload(path))
 
 
 def _load_payload(path: Path) -> Mapping[str, object]:
     try:
-        data = path.read_text(encoding="utf-8")
+        data = path.read_bytes()
     except FileNotFoundError as exc:  # pragma: no cover - defensive
         raise FileNotFoundError(f"Fixture not found: {path}") from exc
 
     try:
-        payload = json.loads(data)
+        payload = _json_loads(data)
     except json.JSONDecodeError as exc:  # pragma: no cover - defensive
         raise ValueError(f"Fixture {path} does not contain valid JSON") from exc
 
@@ -84,9 +101,7 @@ def _title_from_payload(
         label = f"Title {index:02d}"
 
     duration = _parse_duration(payload.get("duration"))
-    chapters = tuple(
-        _parse_duration(item) for item in _iter_chapter_values(payload.get("chapters"))
-    )
+    chapters = tuple(map(_parse_duration, _iter_chapter_values(payload.get("chapters"))))
 
     return title_cls(label=label, duration=duration, chapters=chapters)
 
@@ -135,4 +150,11 @@ def _parse_duration(value: object) -> timedelta:
     if microseconds >= 1_000_000:
         seconds_int += 1
         microseconds -= 1_000_000
-    return timedelta(seconds=seconds_int, microseconds=microseconds)
+    return _interned_timedelta(seconds_int, microseconds)
+
+
+@lru_cache(maxsize=256)
+def _interned_timedelta(seconds: int, microseconds: int) -> timedelta:
+    """Share :class:`timedelta` instances for durations that repeat across chapters."""
+
+    return timedelta(seconds=seconds, microseconds=microseconds)
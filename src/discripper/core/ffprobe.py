@@ -7,6 +7,7 @@ from datetime import timedelta
 from subprocess import PIPE, CompletedProcess, run as subprocess_run
 from typing import TYPE_CHECKING, Callable
 
+from ._json import loads as _json_loads
 from .discovery import ToolAvailability
 
 __all__ = ["inspect_with_ffprobe"]
@@ -63,7 +64,7 @@ def _disc_from_payload(output: str) -> "DiscInfo":
 
 def _load_json(output: str) -> dict[str, object]:
     try:
-        payload = json.loads(output or "{}")
+        payload = _json_loads(output or "{}")
     except json.JSONDecodeError as exc:  # pragma: no cover - defensive
         raise ValueError("Unexpected ffprobe output; not valid JSON") from exc
 
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime, timezone
 from fractions import Fraction
+from functools import lru_cache
 from itertools import zip_longest
+from operator import methodcaller
 from pathlib import Path
 from shutil import which as default_which
 from subprocess import CalledProcessError, CompletedProcess, run as subprocess_run
 from typing import TYPE_CHECKING, Callable, Mapping, Sequence
 
+from ._json import dumps_indented, loads as _json_loads
+
 if TYPE_CHECKING:  # pragma: no cover - used for type checking only
     from . import ClassificationResult, DiscInfo
     from .rip import RipPlan
@@ -81,6 +86,32 @@ def _language_from_stream(stream: Mapping[str, object]) -> str | None:
     return None
 
 
+StreamField = tuple[str, Callable[[Mapping[str, object]], object]]
+
+# Output fields are declared once so the per-stream loop only applies getters.
+_COMMON_STREAM_FIELDS: tuple[StreamField, ...] = (
+    ("index", methodcaller("get", "index")),
+    ("codec", methodcaller("get", "codec_name")),
+    ("codec_long", methodcaller("get", "codec_long_name")),
+    ("bit_rate", lambda stream: _to_int(stream.get("bit_rate"))),
+    ("language", _language_from_stream),
+)
+
+_TYPED_STREAM_FIELDS: dict[str, tuple[StreamField, ...]] = {
+    "video": (
+        ("width", methodcaller("get", "width")),
+        ("height", methodcaller("get", "height")),
+        ("frame_rate", _frame_rate),
+        ("pixel_format", methodcaller("get", "pix_fmt")),
+    ),
+    "audio": (
+        ("channels", methodcaller("get", "channels")),
+        ("channel_layout", methodcaller("get", "channel_layout")),
+        ("sample_rate", lambda stream: _to_int(stream.get("sample_rate"))),
+    ),
+}
+
+
 def _parse_streams(streams: Sequence[object] | None) -> list[dict[str, object]]:
     parsed: list[dict[str, object]] = []
     if not isinstance(streams, Sequence):
@@ -94,33 +125,13 @@ def _parse_streams(streams: Sequence[object] | None) -> list[dict[str, object]]:
         if not isinstance(codec_type, str):
             continue
 
-        stream_info: dict[str, object] = {
-            "type": codec_type,
-            "index": raw_stream.get("index"),
-            "codec": raw_stream.get("codec_name"),
-            "codec_long": raw_stream.get("codec_long_name"),
-            "bit_rate": _to_int(raw_stream.get("bit_rate")),
-            "language": _language_from_stream(raw_stream),
-        }
+        stream_info: dict[str, object] = {"type": codec_type}
+        for key, getter in _COMMON_STREAM_FIELDS:
+            stream_info[key] = getter(raw_stream)
+        for key, getter in _TYPED_STREAM_FIELDS.get(codec_type, ()):
+            stream_info[key] = getter(raw_stream)
 
-        if codec_type == "video":
-            stream_info.update(
-                {
-                    "width": raw_stream.get("width"),
-                    "height": raw_stream.get("height"),
-                    "frame_rate": _frame_rate(raw_stream),
-                    "pixel_format": raw_stream.get("pix_fmt"),
-                }
-            )
-        elif codec_type == "audio":
-            stream_info.update(
-                {
-                    "channels": raw_stream.get("channels"),
-                    "channel_layout": raw_stream.get("channel_layout"),
-                    "sample_rate": _to_int(raw_stream.get("sample_rate")),
-                }
-            )
-        elif codec_type == "subtitle":
+        if codec_type == "subtitle":
             subtitle_tags = raw_stream.get("tags")
             if isinstance(subtitle_tags, Mapping):
                 stream_info["title"] = subtitle_tags.get("title")
@@ -169,7 +180,7 @@ def _ffprobe_payload(
         return None
 
     try:
-        payload = json.loads(result.stdout or "{}")
+        payload = _json_loads(result.stdout or "{}")
     except json.JSONDecodeError:
         return None
 
@@ -208,10 +219,20 @@ def _collect_tool_versions(
 
     versions: dict[str, str | None] = {}
     for tool in sorted(tools):
-        versions[tool] = _probe_version(tool, runner=runner)
+        if runner is subprocess_run:
+            versions[tool] = _default_tool_version(tool)
+        else:
+            versions[tool] = _probe_version(tool, runner=runner)
     return versions
 
 
+# Version strings are probed once per tool per process when the real subprocess
+# runner is used; injected runners bypass the cache.
+@lru_cache(maxsize=16)
+def _default_tool_version(tool: str) -> str | None:
+    return _probe_version(tool, runner=subprocess_run)
+
+
 def _probe_version(tool: str, *, runner: Runner) -> str | None:
     for flag in ("--version", "-version"):
         try:
@@ -257,7 +278,7 @@ def build_metadata_document(
     if classification.episode_codes:
         episode_codes = classification.episode_codes
     else:
-        episode_codes = tuple(None for _ in classification.episodes)
+        episode_codes = (None,) * len(classification.episodes)
 
     for index, pair in enumerate(zip_longest(plans, episode_codes, fillvalue=None), start=1):
         plan = pair[0]
@@ -265,13 +286,13 @@ def build_metadata_document(
             continue
         episode_code = pair[1]
         output_path = plan.destination
-        exists = output_path.exists()
-        size_bytes: int | None = None
-        if exists:
-            try:
-                size_bytes = output_path.stat().st_size
-            except OSError:
-                size_bytes = None
+        size_bytes: int | None
+        try:
+            size_bytes = output_path.stat().st_size
+        except OSError:
+            exists, size_bytes = False, None
+        else:
+            exists = True
 
         ffprobe_payload = None
         if ffprobe_path and exists:
@@ -322,8 +343,13 @@ def build_metadata_document(
 def write_metadata_document(document: Mapping[str, object], directory: Path) -> Path:
     directory.mkdir(parents=True, exist_ok=True)
     path = directory / "metadata.json"
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(document, handle, indent=2, ensure_ascii=False)
-        handle.write("\n")
+    data = memoryview(dumps_indented(document))
+    # The document is a single byte string, so bypass the buffered file layer.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
     return path
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import re
 from functools import lru_cache
 from importlib import import_module
@@ -28,6 +29,15 @@ _SLUG_SEPARATOR = "-"
 _DEFAULT_DIRECTORY_PATTERN = "{slug}"
 _DEFAULT_FILENAME_PATTERN = "{slug}_track{index:02d}{extension}"
 _EPISODE_CODE_PATTERN = re.compile(r"s(?P<season>\d+)e(?P<episode>\d+)", re.IGNORECASE)
+_UNSAFE_RUN_PATTERN = re.compile(r"[^A-Za-z0-9]+")
+# Precomputed NFKD ASCII folding for the Latin-1 Supplement and Latin Extended
+# blocks, which cover nearly all disc labels seen in practice.
+_LATIN_ASCII_FOLD = {
+    codepoint: unicodedata.normalize("NFKD", chr(codepoint))
+    .encode("ascii", "ignore")
+    .decode("ascii")
+    for codepoint in range(0x80, 0x250)
+}
 
 TITLE_SOURCE_KEY = "_title_source"
 
@@ -131,6 +141,18 @@ def _episode_title_from_strategy(
     return normalized or title.label
 
 
+def _fold_to_ascii(value: str) -> str:
+    """Return *value* with diacritics stripped and non-ASCII characters dropped."""
+
+    folded = value.translate(_LATIN_ASCII_FOLD)
+    if folded.isascii():
+        return folded
+
+    normalized = unicodedata.normalize("NFKD", folded)
+    return normalized.encode("ascii", "ignore").decode("ascii")
+
+
+@lru_cache(maxsize=8)
 def _normalize_separator(separator: str) -> str:
     """Return a single ASCII character usable as a separator."""
 
@@ -147,6 +169,7 @@ def _normalize_separator(separator: str) -> str:
     return _FALLBACK_SEPARATOR
 
 
+@lru_cache(maxsize=512)
 def sanitize_component(
     value: str,
     *,
@@ -161,25 +184,19 @@ def sanitize_component(
     instance and trimmed from the ends. When the sanitized value would be empty,
     a fallback name is returned to keep downstream paths valid. Set
     :param:`lowercase` to :data:`True` when the resulting component should be
-    normalized to lowercase for case-insensitive filesystems.
+    normalized to lowercase for case-insensitive filesystems. Results are
+    memoized because the same labels are sanitized repeatedly during a rip.
     """
 
-    normalized = unicodedata.normalize("NFKD", value)
-    ascii_only = normalized.encode("ascii", "ignore").decode("ascii")
     safe_separator = _normalize_separator(separator)
 
-    pieces: list[str] = []
-    previous_was_separator = False
-    for char in ascii_only:
-        if char in _SAFE_CHARS:
-            pieces.append(char)
-            previous_was_separator = False
-        else:
-            if not previous_was_separator:
-                pieces.append(safe_separator)
-                previous_was_separator = True
+    if value.isascii() and all(part.isalnum() for part in value.split(safe_separator)):
+        # Already-safe ASCII values pass through without normalization.
+        return value.lower() if lowercase else value
 
-    sanitized = "".join(pieces).strip(safe_separator)
+    ascii_only = _fold_to_ascii(value)
+
+    sanitized = _UNSAFE_RUN_PATTERN.sub(safe_separator, ascii_only).strip(safe_separator)
     result = sanitized or _FALLBACK_NAME
 
     if lowercase:
@@ -215,30 +232,58 @@ def _output_directory_from_config(config: Mapping[str, object]) -> Path:
     return Path(output_dir_value).expanduser()
 
 
-def _ensure_unique_path(path: Path) -> Path:
-    """Return a path that does not collide with an existing file.
+def _probe_unique_path(parent: str, stem: str, suffix: str) -> Path:
+    """Return the first free ``stem[_N]suffix`` under *parent* by probing each name."""
+
+    path = Path(parent, f"{stem}{suffix}")
+    counter = 0
+    while path.exists():
+        counter += 1
+        path = Path(parent, f"{stem}_{counter}{suffix}")
+    return path
+
+
+def _ensure_unique_path(directory: str, filename: str) -> Path:
+    """Return a path under *directory* that does not collide with an existing file.
 
-    When *path* already exists, the function appends an incrementing suffix of
-    the form ``_1``, ``_2``, … before the file extension until a free name is
+    When *filename* already exists, the function appends an incrementing suffix
+    of the form ``_1``, ``_2``, … before the file extension until a free name is
     found.  The original path is returned unchanged when no collision is
-    detected.
+    detected.  The parent directory is listed once rather than probing each
+    candidate name individually, and candidates are assembled as strings so
+    only the accepted name is wrapped in a :class:`~pathlib.Path`.  When the
+    directory cannot be listed, or the listing misses a collision (for example
+    on a case-insensitive filesystem), each candidate is probed instead.
     """
 
-    if not path.exists():
-        return path
+    parent, name = os.path.split(os.path.join(directory, filename))
+    stem, suffix = os.path.splitext(name)
 
-    stem = path.stem
-    suffix = path.suffix
-    parent = path.parent
-
-    counter = 1
-    while True:
-        candidate = parent / f"{stem}_{counter}{suffix}"
-        if not candidate.exists():
-            return candidate
+    try:
+        with os.scandir(parent) as entries:
+            taken = {
+                entry.name
+                for entry in entries
+                if entry.name.startswith(stem) and entry.name.endswith(suffix)
+            }
+    except (FileNotFoundError, NotADirectoryError):
+        return Path(parent, name)
+    except OSError:
+        return _probe_unique_path(parent, stem, suffix)
+
+    candidate = name
+    counter = 0
+    while candidate in taken:
         counter += 1
+        candidate = f"{stem}_{counter}{suffix}"
 
+    path = Path(parent, candidate)
+    if path.exists():
+        return _probe_unique_path(parent, stem, suffix)
+    return path
 
+
+@lru_cache(maxsize=64)
 def _slugify_title(value: str) -> str:
     """Return a deterministic slug for *value* using ASCII-safe characters.
 
@@ -247,11 +292,11 @@ def _slugify_title(value: str) -> str:
     collapsed to hyphens, output is lowercased, and only alphanumeric
     characters, hyphens, and underscores are preserved. Runs of separators are
     collapsed into a single hyphen. When the resulting slug would be empty, a
-    stable fallback string is returned.
+    stable fallback string is returned. Slugs are memoized because every track
+    of a disc derives its path from the same title.
     """
 
-    normalized = unicodedata.normalize("NFKD", value)
-    ascii_only = normalized.encode("ascii", "ignore").decode("ascii")
+    ascii_only = _fold_to_ascii(value)
 
     pieces: list[str] = []
     previous_was_separator = False
@@ -346,9 +391,9 @@ def _build_slugged_path(
     )
 
     output_root = _output_directory_from_config(config)
-    directory = (output_root / directory_segment).expanduser()
+    directory = os.path.expanduser(os.path.join(output_root, directory_segment))
 
-    return _ensure_unique_path(directory / filename)
+    return _ensure_unique_path(directory, filename)
 
 
 def movie_output_path(
@@ -9,6 +9,7 @@ import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from os import fspath
 from pathlib import Path
 from shutil import which as default_which
@@ -27,6 +28,9 @@ if TYPE_CHECKING:  # pragma: no cover - import for type checking only
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for subprocess output before running idle progress updates.
+_OUTPUT_POLL_INTERVAL = 0.25
+
 
 def _log_rip_failure(plan: RipPlan, reason: str, exit_code: int) -> None:
     """Emit a structured log entry describing a failed rip attempt."""
@@ -353,7 +357,7 @@ def _execute_plan_with_progress(
                     break
 
             try:
-                source, line = line_queue.get(timeout=0.25)
+                source, line = line_queue.get(timeout=_OUTPUT_POLL_INTERVAL)
             except queue.Empty:
                 if progress is not None:
                     try:
@@ -564,15 +568,19 @@ def rip_disc(
     associated episode code (``s01eNN``) when available.  It must return the
     output path where the resulting file should be written.  The function does
     not perform any I/O; it simply prepares plans by delegating to
-    :func:`rip_title` for every relevant title.
+    :func:`rip_title` for every relevant title.  Tool lookups through *which*
+    are memoized for the duration of the call so ``PATH`` is searched once per
+    command rather than once per title.
     """
 
+    which = lru_cache(maxsize=None)(which)
+
     episodes = classification.episodes
     episode_codes: Tuple[str | None, ...]
     if classification.episode_codes:
         episode_codes = classification.episode_codes
     else:
-        episode_codes = tuple(None for _ in episodes)
+        episode_codes = (None,) * len(episodes)
 
     plans = []
     for index, (title, code) in enumerate(zip(episodes, episode_codes), start=1):
@@ -0,0 +1,81 @@
+"""Shared pytest fixtures for the discripper test suite."""
+
+from __future__ import annotations
+
+import logging
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from discripper import config
+from discripper.core import DiscInfo
+from discripper.core.fake import inspect_from_fixture
+
+_SAMPLES_DIR = Path(__file__).resolve().parents[1] / "samples"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--reuse-venv",
+        action="store_true",
+        default=False,
+        help="Reuse the installation test's pip virtualenv from ~/.cache/discripper-tests.",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache() -> Iterator[None]:
+    """Keep parsed configuration files from leaking between tests."""
+
+    config.clear_cache()
+    yield
+    config.clear_cache()
+
+
+@pytest.fixture
+def isolated_logging() -> Iterator[logging.Logger]:
+    """Snapshot the root logger and restore its handlers and level afterwards."""
+
+    root = logging.getLogger()
+    saved_handlers = root.handlers[:]
+    saved_level = root.level
+    try:
+        yield root
+    finally:
+        for handler in root.handlers:
+            if handler not in saved_handlers:
+                handler.close()
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+
+@pytest.fixture(scope="session")
+def _device_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    template = tmp_path_factory.mktemp("device") / "device"
+    template.write_bytes(b"ready")
+    return template
+
+
+@pytest.fixture
+def device(tmp_path: Path, _device_template: Path) -> Path:
+    """Return a readable stand-in for an optical device inside ``tmp_path``."""
+
+    destination = tmp_path / "device"
+    shutil.copyfile(_device_template, destination)
+    return destination
+
+
+@pytest.fixture(scope="session")
+def simulated_movie_disc() -> DiscInfo:
+    """Return the frozen disc parsed from ``samples/simulated_movie.json``."""
+
+    return inspect_from_fixture("simulated_movie", fixture_dir=_SAMPLES_DIR)
+
+
+@pytest.fixture(scope="session")
+def simulated_series_disc() -> DiscInfo:
+    """Return the frozen disc parsed from ``samples/simulated_series.json``."""
+
+    return inspect_from_fixture("simulated_series", fixture_dir=_SAMPLES_DIR)
@@ -6,24 +6,25 @@ import os
 import subprocess
 from pathlib import Path
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
 
 def test_acceptance_script_runs() -> None:
     """Running the acceptance script succeeds and reports success."""
 
-    repo_root = Path(__file__).resolve().parents[1]
-    script = repo_root / "scripts" / "acceptance.sh"
+    script = _REPO_ROOT / "scripts" / "acceptance.sh"
 
     assert script.exists(), "acceptance script must exist"
 
     env = os.environ.copy()
     env.setdefault(
         "PYTHONPATH",
-        f"{repo_root / 'src'}{os.pathsep}{env.get('PYTHONPATH', '')}".rstrip(os.pathsep),
+        f"{_REPO_ROOT / 'src'}{os.pathsep}{env.get('PYTHONPATH', '')}".rstrip(os.pathsep),
     )
 
     result = subprocess.run(
         ["bash", str(script)],
-        cwd=repo_root,
+        cwd=_REPO_ROOT,
         capture_output=True,
         check=True,
         text=True,
@@ -12,56 +12,33 @@ from discripper.core import (
 )
 
 
-def test_classify_disc_movie_fixture_selects_longest_title():
-    disc = inspect_from_fixture("sample_disc")
-
-    result = classify_disc(disc)
-
-    assert result.disc_type == "movie"
-    assert result.episodes == (disc.titles[0],)
-    assert result.episode_codes == ()
-    assert result.numbered_episodes == ()
-
-
-def test_classify_disc_movie_selects_longest_title():
-    long_feature = TitleInfo(label="Main Feature", duration=timedelta(minutes=110))
-    extras = (
+_LONG_FEATURE = TitleInfo(label="Main Feature", duration=timedelta(minutes=110))
+_MOVIE_DISC = DiscInfo(
+    label="Sample Movie",
+    titles=(
+        _LONG_FEATURE,
         TitleInfo(label="Trailer", duration=timedelta(minutes=5)),
         TitleInfo(label="Deleted Scenes", duration=timedelta(minutes=8)),
-    )
-    disc = DiscInfo(label="Sample Movie", titles=(long_feature, *extras))
-
-    result = classify_disc(disc)
-
-    assert result.disc_type == "movie"
-    assert result.episodes == (long_feature,)
-    assert result.episode_codes == ()
-    assert result.numbered_episodes == ()
-
-
-def test_classify_disc_series_detects_similar_episodes():
-    episode_titles = (
-        TitleInfo(label="Ep1", duration=timedelta(minutes=25)),
-        TitleInfo(label="Ep2", duration=timedelta(minutes=24)),
-        TitleInfo(label="Ep3", duration=timedelta(minutes=26)),
-        TitleInfo(label="Bonus", duration=timedelta(minutes=70)),
-    )
-    disc = DiscInfo(label="Sample Series", titles=episode_titles)
+    ),
+)
 
-    result = classify_disc(disc)
+_EPISODE_TITLES = (
+    TitleInfo(label="Ep1", duration=timedelta(minutes=25)),
+    TitleInfo(label="Ep2", duration=timedelta(minutes=24)),
+    TitleInfo(label="Ep3", duration=timedelta(minutes=26)),
+)
+_SERIES_DISC = DiscInfo(
+    label="Sample Series",
+    titles=(*_EPISODE_TITLES, TitleInfo(label="Bonus", duration=timedelta(minutes=70))),
+)
+_EPISODES_ONLY_DISC = DiscInfo(label="Sample Series", titles=_EPISODE_TITLES)
 
-    assert result.disc_type == "series"
-    assert result.episodes == (
-        episode_titles[1],
-        episode_titles[0],
-        episode_titles[2],
-    )
-    assert result.episode_codes == ("s01e01", "s01e02", "s01e03")
-    assert result.numbered_episodes == (
-        ("s01e01", episode_titles[1]),
-        ("s01e02", episode_titles[0]),
-        ("s01e03", episode_titles[2]),
-    )
+_AMBIGUOUS_TITLES = (
+    TitleInfo(label="Feature", duration=timedelta(minutes=50)),
+    TitleInfo(label="Bonus", duration=timedelta(minutes=10)),
+    TitleInfo(label="Trailer", duration=timedelta(minutes=5)),
+)
+_AMBIGUOUS_DISC = DiscInfo(label="Ambiguous Disc", titles=_AMBIGUOUS_TITLES)
 
 
 def test_classify_disc_series_from_fixture_detects_all_six_episodes():
@@ -84,55 +61,40 @@ def test_classify_disc_series_from_fixture_detects_all_six_episodes():
 
 
 def test_classify_disc_threshold_overrides_from_config():
-    episode_titles = (
-        TitleInfo(label="Ep1", duration=timedelta(minutes=25)),
-        TitleInfo(label="Ep2", duration=timedelta(minutes=24)),
-        TitleInfo(label="Ep3", duration=timedelta(minutes=26)),
-    )
-    disc = DiscInfo(label="Sample Series", titles=episode_titles)
-
     thresholds = thresholds_from_config(
         {"classification": {"series_min_duration_minutes": 30}}
     )
-    result = classify_disc(disc, thresholds=thresholds)
+    result = classify_disc(_EPISODES_ONLY_DISC, thresholds=thresholds)
 
     assert result.disc_type == "movie"
-    assert result.episodes == (episode_titles[2],)
+    assert result.episodes == (_EPISODE_TITLES[2],)
     assert result.episode_codes == ()
 
 
 def test_classify_disc_logs_warning_on_ambiguous_disc(caplog):
-    ambiguous_titles = (
-        TitleInfo(label="Feature", duration=timedelta(minutes=50)),
-        TitleInfo(label="Bonus", duration=timedelta(minutes=10)),
-        TitleInfo(label="Trailer", duration=timedelta(minutes=5)),
-    )
-    disc = DiscInfo(label="Ambiguous Disc", titles=ambiguous_titles)
-
     with caplog.at_level(logging.WARNING):
-        result = classify_disc(disc)
+        result = classify_disc(_AMBIGUOUS_DISC)
 
     assert result.disc_type == "movie"
-    assert result.episodes == (ambiguous_titles[0],)
-
-    warnings = [record for record in caplog.records if record.levelno == logging.WARNING]
-    assert warnings, "Expected a warning when falling back to movie classification"
-    assert "Ambiguous disc structure" in warnings[0].message
-
+    assert result.episodes == (_AMBIGUOUS_TITLES[0],)
 
-def test_classify_disc_ambiguous_fixture_defaults_to_movie():
-    disc = inspect_from_fixture("ambiguous_disc")
-
-    result = classify_disc(disc)
-
-    assert result.disc_type == "movie"
-    assert result.episodes == (disc.titles[0],)
-    assert result.episode_codes == ()
+    warning = next(
+        (record for record in caplog.records if record.levelno == logging.WARNING), None
+    )
+    assert warning is not None, "Expected a warning when falling back to movie classification"
+    assert "Ambiguous disc structure" in warning.message
 
 
 @pytest.mark.parametrize(
-    ("fixture_name", "expected_type", "expected_labels", "expected_codes"),
+    ("source", "expected_type", "expected_labels", "expected_codes"),
     [
+        (_MOVIE_DISC, "movie", ["Main Feature"], ()),
+        (
+            _SERIES_DISC,
+            "series",
+            ["Ep2", "Ep1", "Ep3"],
+            ("s01e01", "s01e02", "s01e03"),
+        ),
         ("sample_disc", "movie", ["Pilot"], ()),
         ("single_movie_disc", "movie", ["Main Feature"], ()),
         (
@@ -157,14 +119,22 @@ def test_classify_disc_ambiguous_fixture_defaults_to_movie():
         ),
         ("ambiguous_disc", "movie", ["Borderline Feature"], ()),
     ],
+    ids=[
+        "in-memory-movie",
+        "in-memory-series",
+        "sample_disc",
+        "single_movie_disc",
+        "six_episode_series",
+        "ambiguous_disc",
+    ],
 )
-def test_fixture_classifications_are_deterministic(
-    fixture_name: str,
+def test_classifications_are_deterministic(
+    source: str | DiscInfo,
     expected_type: str,
     expected_labels: list[str],
     expected_codes: tuple[str, ...],
 ) -> None:
-    disc = inspect_from_fixture(fixture_name)
+    disc = inspect_from_fixture(source) if isinstance(source, str) else source
 
     result = classify_disc(disc)
 
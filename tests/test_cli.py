@@ -3,16 +3,14 @@
 from __future__ import annotations
 
 import copy
-import logging
 import json
+import logging
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from subprocess import CompletedProcess
-
 from typing import Mapping, Sequence
 
 import pytest
-import yaml
 
 from discripper import cli, config as config_module
 from discripper.core import (
@@ -28,79 +26,118 @@ from discripper.core import (
 )
 
 
-def _write_config(tmp_path: Path, content: dict[str, object]) -> Path:
-    config_path = tmp_path / "config.yaml"
-    config_path.write_text(yaml.safe_dump(content), encoding="utf-8")
+@pytest.fixture(scope="module")
+def config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("cli_configs")
+
+
+def _write_config(config_dir: Path, name: str, content: dict[str, object]) -> Path:
+    # JSON is a subset of YAML, so load_config reads this without a YAML emitter.
+    config_path = config_dir / f"{name}.yaml"
+    config_path.write_text(json.dumps(content, indent=2), encoding="utf-8")
     return config_path
 
 
-def _install_movie_pipeline(
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-    *,
-    use_fallback: bool = False,
-    dry_run: bool = False,
-):
-    events: list[object] = []
-    title = TitleInfo(label="Main Feature", duration=timedelta(minutes=95))
-    disc = DiscInfo(label="Sample Disc", titles=(title,))
-    classification = ClassificationResult("movie", (title,))
-
-    tools = InspectionTools(
-        dvd=None if use_fallback else ToolAvailability("lsdvd", "/usr/bin/lsdvd"),
-        fallback=ToolAvailability("ffprobe", "/usr/bin/ffprobe") if use_fallback else None,
-        blu_ray=None,
-    )
+_DUR_44MIN = timedelta(minutes=44)
+_DUR_45MIN = timedelta(minutes=45)
+_DUR_90MIN = timedelta(minutes=90)
+_DUR_95MIN = timedelta(minutes=95)
 
-    def fake_discover() -> InspectionTools:
-        events.append(("discover", use_fallback))
-        return tools
+_MOVIE_TITLE = TitleInfo(label="Main Feature", duration=_DUR_95MIN)
+_MOVIE_DISC = DiscInfo(label="Sample Disc", titles=(_MOVIE_TITLE,))
+_MOVIE_CLASSIFICATION = ClassificationResult("movie", (_MOVIE_TITLE,))
+_MOVIE_TOOLS_DVD = InspectionTools(
+    dvd=ToolAvailability("lsdvd", "/usr/bin/lsdvd"),
+    fallback=None,
+    blu_ray=None,
+)
+_MOVIE_TOOLS_FALLBACK = InspectionTools(
+    dvd=None,
+    fallback=ToolAvailability("ffprobe", "/usr/bin/ffprobe"),
+    blu_ray=None,
+)
 
-    monkeypatch.setattr(cli, "discover_inspection_tools", fake_discover)
+_SERIES_EPISODE_ONE = TitleInfo(label="Episode One", duration=_DUR_44MIN)
+_SERIES_EPISODE_TWO = TitleInfo(label="Episode Two", duration=_DUR_45MIN)
+_SERIES_DISC = DiscInfo(
+    label="Sample Series", titles=(_SERIES_EPISODE_ONE, _SERIES_EPISODE_TWO)
+)
+_SERIES_CLASSIFICATION = ClassificationResult(
+    "series",
+    (_SERIES_EPISODE_ONE, _SERIES_EPISODE_TWO),
+    ("s01e01", "s01e02"),
+)
+_SERIES_TOOLS = _MOVIE_TOOLS_DVD
+_NO_TOOLS = InspectionTools(dvd=None, fallback=None, blu_ray=None)
 
-    if use_fallback:
-        def unexpected_dvd(*_args, **_kwargs):
-            raise AssertionError("DVD inspector should not be used when only fallback exists")
+_SAMPLE_TITLE = TitleInfo(label="Sample", duration=timedelta(minutes=5))
+_RIP_COMPLETED: CompletedProcess[str] = CompletedProcess(("echo", "rip"), 0)
 
-        monkeypatch.setattr(cli, "inspect_dvd", unexpected_dvd)
+_SIMULATION_FIXTURE = json.dumps(
+    {
+        "label": "Simulated Disc",
+        "titles": [{"label": "Simulated Feature", "duration": 5400}],
+    }
+).encode("utf-8")
 
-        def fake_inspect(device: str, *, tool: ToolAvailability) -> DiscInfo:
-            events.append(("inspect", tool.command))
-            return disc
 
-        monkeypatch.setattr(cli, "inspect_with_ffprobe", fake_inspect)
-    else:
-        def unexpected_ffprobe(*_args, **_kwargs):
-            raise AssertionError("Fallback inspector should not be used when DVD tool exists")
+def _unexpected_dvd(*_args, **_kwargs):
+    raise AssertionError("DVD inspector should not be used when only fallback exists")
 
-        monkeypatch.setattr(cli, "inspect_with_ffprobe", unexpected_ffprobe)
 
-        def fake_inspect(device: str, *, tool: ToolAvailability) -> DiscInfo:
-            events.append(("inspect", tool.command))
-            return disc
+def _unexpected_ffprobe(*_args, **_kwargs):
+    raise AssertionError("Fallback inspector should not be used when DVD tool exists")
 
-        monkeypatch.setattr(cli, "inspect_dvd", fake_inspect)
 
-    def fake_classify(disc_info: DiscInfo, *, thresholds) -> ClassificationResult:
-        events.append(("classify", disc_info.label))
-        return classification
+def _unexpected_series_output_path(*_args, **_kwargs):
+    raise AssertionError("Series output path should not be used for movie classification")
 
-    monkeypatch.setattr(cli, "classify_disc", fake_classify)
 
-    def fake_movie_output_path(
-        title_info: TitleInfo, config: dict[str, object], *, track_index: int = 1
-    ) -> Path:
-        events.append(("movie_output_path", title_info.label))
-        return tmp_path / f"output-{track_index}.mp4"
+def _unexpected_movie_output_path(*_args, **_kwargs):
+    raise AssertionError("Movie output path should not be used for series classification")
 
-    monkeypatch.setattr(cli, "movie_output_path", fake_movie_output_path)
 
-    def unexpected_series_output_path(*_args, **_kwargs):
-        raise AssertionError("Series output path should not be used for movie classification")
+class _PipelineFakes:
+    """Record pipeline events in call order and as a set for membership checks."""
 
-    monkeypatch.setattr(cli, "series_output_path", unexpected_series_output_path)
+    def __init__(self) -> None:
+        self.events: list[tuple[object, ...]] = []
+        self.event_types: set[tuple[object, ...]] = set()
 
-    def fake_rip_disc(
+    def _record(self, event: tuple[object, ...]) -> None:
+        self.events.append(event)
+        self.event_types.add(event)
+
+
+class _MoviePipelineFakes(_PipelineFakes):
+    """Bound-method fakes for a single-title movie pipeline run."""
+
+    def __init__(self, tmp_path: Path, *, use_fallback: bool, dry_run: bool) -> None:
+        super().__init__()
+        self._tmp_path = tmp_path
+        self._use_fallback = use_fallback
+        self._dry_run = dry_run
+
+    def discover(self) -> InspectionTools:
+        self._record(("discover", self._use_fallback))
+        return _MOVIE_TOOLS_FALLBACK if self._use_fallback else _MOVIE_TOOLS_DVD
+
+    def inspect(self, device: str, *, tool: ToolAvailability) -> DiscInfo:
+        self._record(("inspect", tool.command))
+        return _MOVIE_DISC
+
+    def classify(self, disc_info: DiscInfo, *, thresholds) -> ClassificationResult:
+        self._record(("classify", disc_info.label))
+        return _MOVIE_CLASSIFICATION
+
+    def movie_output_path(
+        self, title_info: TitleInfo, config: dict[str, object], *, track_index: int = 1
+    ) -> Path:
+        self._record(("movie_output_path", title_info.label))
+        return self._tmp_path / f"output-{track_index}.mp4"
+
+    def rip_disc(
+        self,
         device: str,
         classification_value: ClassificationResult,
         destination_factory,
@@ -108,28 +145,25 @@ def _install_movie_pipeline(
         dry_run: bool,
         which=None,
     ) -> tuple[RipPlan, ...]:
-        events.append(("rip_disc", device, dry_run))
+        self._record(("rip_disc", device, dry_run))
         destination = destination_factory(classification_value.episodes[0], None, 1)
         plan = RipPlan(
             device=device,
             title=classification_value.episodes[0],
-            destination=Path(destination),
+            destination=destination,
             command=("echo", "rip"),
             will_execute=not dry_run,
         )
         return (plan,)
 
-    monkeypatch.setattr(cli, "rip_disc", fake_rip_disc)
-
-    def fake_run(plan: RipPlan):
-        events.append(("run_rip_plan", plan.destination))
-        if plan.will_execute and dry_run:
+    def run(self, plan: RipPlan):
+        self._record(("run_rip_plan", plan.destination))
+        if plan.will_execute and self._dry_run:
             raise AssertionError("Plan should respect dry-run flag")
         return None
 
-    monkeypatch.setattr(cli, "run_rip_plan", fake_run)
-
-    def fake_emit_metadata(
+    def emit_metadata(
+        self,
         disc_value: DiscInfo,
         classification_value: ClassificationResult,
         plans_value: Sequence[RipPlan],
@@ -137,21 +171,17 @@ def _install_movie_pipeline(
     ) -> None:
         if config_value.get("dry_run", False):
             return
-        events.append(
+        self._record(
             (
                 "metadata",
-                [plan.destination for plan in plans_value],
+                tuple(plan.destination for plan in plans_value),
                 config_value.get("dry_run", False),
             )
         )
 
-    monkeypatch.setattr(cli, "_emit_metadata_document", fake_emit_metadata)
-
-    return events
-
 
 def test_metadata_directory_for_plans_respects_override(tmp_path: Path) -> None:
-    title = TitleInfo(label="Feature", duration=timedelta(minutes=90))
+    title = TitleInfo(label="Feature", duration=_DUR_90MIN)
     destination = tmp_path / "slug" / "slug_track01.mp4"
     plan = RipPlan(
         device="/dev/sr0",
@@ -160,7 +190,7 @@ def test_metadata_directory_for_plans_respects_override(tmp_path: Path) -> None:
         command=("echo",),
         will_execute=True,
     )
-    config = copy.deepcopy(config_module.DEFAULT_CONFIG)
+    config = config_module.clone_default_config()
     override_dir = tmp_path / "metadata"
     config["metadata"]["directory"] = str(override_dir)
 
@@ -170,7 +200,7 @@ def test_metadata_directory_for_plans_respects_override(tmp_path: Path) -> None:
 
 
 def test_metadata_directory_for_plans_honors_output_root(tmp_path: Path) -> None:
-    title = TitleInfo(label="Feature", duration=timedelta(minutes=90))
+    title = TitleInfo(label="Feature", duration=_DUR_90MIN)
     destination = tmp_path / "slug" / "slug_track01.mp4"
     plan = RipPlan(
         device="/dev/sr0",
@@ -179,7 +209,7 @@ def test_metadata_directory_for_plans_honors_output_root(tmp_path: Path) -> None
         command=("echo",),
         will_execute=True,
     )
-    config = copy.deepcopy(config_module.DEFAULT_CONFIG)
+    config = config_module.clone_default_config()
     output_root = tmp_path / "library"
     config["output_directory"] = str(output_root)
     config["metadata"]["directory"] = None
@@ -190,47 +220,27 @@ def test_metadata_directory_for_plans_honors_output_root(tmp_path: Path) -> None
     assert directory == output_root
 
 
-def _install_series_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
-    events: list[object] = []
-    title_one = TitleInfo(label="Episode One", duration=timedelta(minutes=44))
-    title_two = TitleInfo(label="Episode Two", duration=timedelta(minutes=45))
-    disc = DiscInfo(label="Sample Series", titles=(title_one, title_two))
-    classification = ClassificationResult(
-        "series",
-        (title_one, title_two),
-        ("s01e01", "s01e02"),
-    )
-
-    tools = InspectionTools(
-        dvd=ToolAvailability("lsdvd", "/usr/bin/lsdvd"),
-        fallback=None,
-        blu_ray=None,
-    )
-
-    def fake_discover() -> InspectionTools:
-        events.append(("discover", "series"))
-        return tools
-
-    monkeypatch.setattr(cli, "discover_inspection_tools", fake_discover)
-
-    def fake_inspect(device: str, *, tool: ToolAvailability) -> DiscInfo:
-        events.append(("inspect", tool.command))
-        return disc
+class _SeriesPipelineFakes(_PipelineFakes):
+    """Bound-method fakes for a two-episode series pipeline run."""
 
-    monkeypatch.setattr(cli, "inspect_dvd", fake_inspect)
+    def __init__(self, tmp_path: Path) -> None:
+        super().__init__()
+        self._tmp_path = tmp_path
 
-    def fake_classify(disc_info: DiscInfo, *, thresholds) -> ClassificationResult:
-        events.append(("classify", disc_info.label))
-        return classification
+    def discover(self) -> InspectionTools:
+        self._record(("discover", "series"))
+        return _SERIES_TOOLS
 
-    monkeypatch.setattr(cli, "classify_disc", fake_classify)
+    def inspect(self, device: str, *, tool: ToolAvailability) -> DiscInfo:
+        self._record(("inspect", tool.command))
+        return _SERIES_DISC
 
-    def unexpected_movie_output_path(*_args, **_kwargs):
-        raise AssertionError("Movie output path should not be used for series classification")
+    def classify(self, disc_info: DiscInfo, *, thresholds) -> ClassificationResult:
+        self._record(("classify", disc_info.label))
+        return _SERIES_CLASSIFICATION
 
-    monkeypatch.setattr(cli, "movie_output_path", unexpected_movie_output_path)
-
-    def fake_series_output_path(
+    def series_output_path(
+        self,
         series_label: str,
         title_info: TitleInfo,
         episode_code: str,
@@ -238,14 +248,13 @@ def _install_series_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
         *,
         track_index: int = 1,
     ) -> Path:
-        events.append(
+        self._record(
             ("series_output_path", series_label, episode_code, title_info.label, track_index)
         )
-        return tmp_path / f"{track_index:02d}_{episode_code}_{title_info.label}.mp4"
-
-    monkeypatch.setattr(cli, "series_output_path", fake_series_output_path)
+        return self._tmp_path / f"{track_index:02d}_{episode_code}_{title_info.label}.mp4"
 
-    def fake_rip_disc(
+    def rip_disc(
+        self,
         device: str,
         classification_value: ClassificationResult,
         destination_factory,
@@ -253,7 +262,7 @@ def _install_series_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
         dry_run: bool,
         which=None,
     ) -> tuple[RipPlan, ...]:
-        events.append(("rip_disc", device, dry_run))
+        self._record(("rip_disc", device, dry_run))
         plans: list[RipPlan] = []
         for index, (title_info, episode_code) in enumerate(
             zip(classification_value.episodes, classification_value.episode_codes),
@@ -264,22 +273,67 @@ def _install_series_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
                 RipPlan(
                     device=device,
                     title=title_info,
-                    destination=Path(destination),
+                    destination=destination,
                     command=("echo", episode_code),
                     will_execute=not dry_run,
                 )
             )
         return tuple(plans)
 
-    monkeypatch.setattr(cli, "rip_disc", fake_rip_disc)
-
-    def fake_run(plan: RipPlan):
-        events.append(("run_rip_plan", plan.destination, plan.command[-1]))
+    def run(self, plan: RipPlan):
+        self._record(("run_rip_plan", plan.destination, plan.command[-1]))
         return None
 
-    monkeypatch.setattr(cli, "run_rip_plan", fake_run)
 
-    return events
+@pytest.fixture
+def install_pipeline(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Return an installer that patches :mod:`discripper.cli` with pipeline fakes.
+
+    Keyword *overrides* replace individual entries, so each test states the one
+    or two pieces of the pipeline it customises next to the default fakes.
+    """
+
+    def install(
+        kind: str = "movie",
+        *,
+        use_fallback: bool = False,
+        dry_run: bool = False,
+        **overrides: object,
+    ) -> _PipelineFakes:
+        fakes: _PipelineFakes
+        if kind == "series":
+            fakes = series = _SeriesPipelineFakes(tmp_path)
+            patches: dict[str, object] = {
+                "discover_inspection_tools": series.discover,
+                "inspect_dvd": series.inspect,
+                "classify_disc": series.classify,
+                "movie_output_path": _unexpected_movie_output_path,
+                "series_output_path": series.series_output_path,
+                "rip_disc": series.rip_disc,
+                "run_rip_plan": series.run,
+            }
+        else:
+            fakes = movie = _MoviePipelineFakes(
+                tmp_path, use_fallback=use_fallback, dry_run=dry_run
+            )
+            patches = {
+                "discover_inspection_tools": movie.discover,
+                "inspect_dvd": _unexpected_dvd if use_fallback else movie.inspect,
+                "inspect_with_ffprobe": movie.inspect if use_fallback else _unexpected_ffprobe,
+                "classify_disc": movie.classify,
+                "movie_output_path": movie.movie_output_path,
+                "series_output_path": _unexpected_series_output_path,
+                "rip_disc": movie.rip_disc,
+                "run_rip_plan": movie.run,
+                "_emit_metadata_document": movie.emit_metadata,
+            }
+
+        patches.update(overrides)
+        for name, replacement in patches.items():
+            monkeypatch.setattr(cli, name, replacement)
+        return fakes
+
+    return install
 
 
 def test_parse_arguments_supports_expected_flags() -> None:
@@ -319,11 +373,33 @@ def test_parse_arguments_includes_device_with_default() -> None:
     assert args.device == "/dev/sr0"
 
 
-def test_resolve_cli_config_uses_custom_config_path(tmp_path) -> None:
+def test_parse_arguments_returns_independent_default_namespaces() -> None:
+    """Mutating one default namespace does not leak into later parses."""
+
+    first = cli.parse_arguments([])
+    first.device = "/dev/dvd"
+
+    assert cli.parse_arguments([]).device == "/dev/sr0"
+
+
+def test_parse_arguments_copies_list_valued_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Mutating a list default on one namespace does not reach the cached defaults."""
+
+    monkeypatch.setattr(cli._default_namespace(), "extra", ["a"], raising=False)
+
+    cli.parse_arguments([]).extra.append("b")
+
+    assert cli.parse_arguments([]).extra == ["a"]
+
+
+def test_resolve_cli_config_uses_custom_config_path(
+    config_dir: Path, request: pytest.FixtureRequest
+) -> None:
     """Providing --config loads and returns the specified configuration file."""
 
     config_path = _write_config(
-        tmp_path,
+        config_dir,
+        request.node.name,
         {
             "logging": {"level": "WARNING"},
             "dry_run": False,
@@ -337,81 +413,97 @@ def test_resolve_cli_config_uses_custom_config_path(tmp_path) -> None:
     assert resolved["dry_run"] is False
 
 
-def test_resolve_cli_config_sets_device_from_arguments(tmp_path) -> None:
-    """The device argument is propagated into the resolved configuration."""
+def test_resolve_cli_config_passes_config_path_to_loader() -> None:
+    """A custom loader receives the --config path instead of the file being read."""
 
-    config_path = _write_config(tmp_path, {})
+    seen: list[str | None] = []
 
-    args = cli.parse_arguments(["--config", str(config_path), "/dev/dvd"])
-    resolved = cli.resolve_cli_config(args)
+    def loader(path: str | None) -> dict[str, object]:
+        seen.append(path)
+        return {"dry_run": False}
+
+    args = cli.parse_arguments(["--config", "custom.yaml"])
+    resolved = cli.resolve_cli_config(args, config_loader=loader)
+
+    assert seen == ["custom.yaml"]
+    assert resolved["dry_run"] is False
+
+
+def test_resolve_cli_config_sets_device_from_arguments() -> None:
+    """The device argument is propagated into the resolved configuration."""
+
+    args = cli.parse_arguments(["--config", "config.yaml", "/dev/dvd"])
+    resolved = cli.resolve_cli_config(args, config_loader=lambda _path: {})
 
     assert resolved["device"] == "/dev/dvd"
 
 
-def test_resolve_cli_config_overrides_logging_with_verbose(tmp_path) -> None:
+def test_resolve_cli_config_overrides_logging_with_verbose() -> None:
     """--verbose forces the logging level to DEBUG regardless of config value."""
 
-    config_path = _write_config(tmp_path, {"logging": {"level": "INFO"}})
-
-    args = cli.parse_arguments(["--config", str(config_path), "--verbose"])
-    resolved = cli.resolve_cli_config(args)
+    args = cli.parse_arguments(["--config", "config.yaml", "--verbose"])
+    resolved = cli.resolve_cli_config(
+        args, config_loader=lambda _path: {"logging": {"level": "INFO"}}
+    )
 
     assert resolved["logging"]["level"] == "DEBUG"
 
 
-def test_resolve_cli_config_sets_dry_run_flag(tmp_path) -> None:
+def test_resolve_cli_config_sets_dry_run_flag() -> None:
     """--dry-run updates the configuration to reflect a dry run."""
 
-    config_path = _write_config(tmp_path, {"dry_run": False})
-
-    args = cli.parse_arguments(["--config", str(config_path), "--dry-run"])
-    resolved = cli.resolve_cli_config(args)
+    args = cli.parse_arguments(["--config", "config.yaml", "--dry-run"])
+    resolved = cli.resolve_cli_config(args, config_loader=lambda _path: {"dry_run": False})
 
     assert resolved["dry_run"] is True
 
 
 def test_resolve_cli_config_applies_precedence(tmp_path) -> None:
-    """Defaults are overridden by config file, which in turn yields to CLI flags."""
+    """Defaults are overridden by the loaded config, which in turn yields to CLI flags."""
 
-    config_path = _write_config(
-        tmp_path,
-        {
-            "output_directory": "/mnt/custom",
-            "logging": {"level": "WARNING", "file": str(tmp_path / "config.log")},
-            "dry_run": False,
-        },
-    )
+    file_config = {
+        "output_directory": "/mnt/custom",
+        "logging": {"level": "WARNING", "file": str(tmp_path / "config.log")},
+        "dry_run": False,
+    }
 
     args = cli.parse_arguments(
         [
             "--config",
-            str(config_path),
+            "config.yaml",
             "--verbose",
             "--dry-run",
             "--log-file",
             str(tmp_path / "cli.log"),
         ]
     )
-    resolved = cli.resolve_cli_config(args)
+    resolved = cli.resolve_cli_config(args, config_loader=lambda _path: file_config)
 
     assert resolved["output_directory"] == "/mnt/custom"
     assert resolved["logging"]["level"] == "DEBUG"
     assert resolved["dry_run"] is True
     assert resolved["logging"]["file"] == str(tmp_path / "cli.log")
+    assert resolved["naming"] == config_module.DEFAULT_CONFIG["naming"]
+
+
+def test_resolve_cli_config_validates_loader_result() -> None:
+    """Injected loaders get the same schema validation as configuration files."""
+
+    args = cli.parse_arguments(["--config", "config.yaml"])
+
+    with pytest.raises(ValueError, match="dry_run"):
+        cli.resolve_cli_config(args, config_loader=lambda _path: {"dry_run": "yes"})
 
 
 def test_resolve_cli_config_overrides_log_file_with_flag(tmp_path) -> None:
     """--log-file takes precedence over any configured log file path."""
 
-    config_path = _write_config(
-        tmp_path,
-        {"logging": {"level": "INFO", "file": str(tmp_path / "config.log")}},
-    )
+    file_config = {"logging": {"level": "INFO", "file": str(tmp_path / "config.log")}}
 
     args = cli.parse_arguments(
-        ["--config", str(config_path), "--log-file", str(tmp_path / "cli.log")]
+        ["--config", "config.yaml", "--log-file", str(tmp_path / "cli.log")]
     )
-    resolved = cli.resolve_cli_config(args)
+    resolved = cli.resolve_cli_config(args, config_loader=lambda _path: file_config)
 
     assert resolved["logging"]["file"] == str(tmp_path / "cli.log")
 
@@ -432,7 +524,7 @@ def test_resolve_cli_config_layers_defaults_config_cli(
     assert resolved_defaults["logging"]["file"] is None
 
     managed_config.write_text(
-        yaml.safe_dump(
+        json.dumps(
             {
                 "output_directory": "/mnt/config",
                 "logging": {"level": "WARNING", "file": str(tmp_path / "config.log")},
@@ -483,7 +575,7 @@ def test_resolve_cli_config_marks_cli_title_source() -> None:
 def test_resolve_cli_config_marks_config_title_source(monkeypatch: pytest.MonkeyPatch) -> None:
     """Titles supplied via configuration files retain their provenance."""
 
-    base = copy.deepcopy(config_module.DEFAULT_CONFIG)
+    base = config_module.clone_default_config()
     base["title"] = "Preconfigured"
 
     def fake_load_config(_path: object) -> dict[str, object]:
@@ -525,145 +617,71 @@ def test_cli_main_help_output_lists_expected_options(capsys) -> None:
     assert "-t TITLE, --title TITLE" in captured
 
 
-def test_configure_logging_writes_to_file(tmp_path) -> None:
+def test_configure_logging_writes_to_file(tmp_path, isolated_logging) -> None:
     """configure_logging attaches a file handler when a path is supplied."""
 
     log_path = tmp_path / "logs" / "discripper.log"
     config = {"logging": {"level": "INFO", "file": str(log_path)}}
 
-    logging.basicConfig(level=logging.NOTSET, force=True)
-    try:
-        cli.configure_logging(config)
-        logging.getLogger().info("file logging active")
-        logging.shutdown()
-    finally:
-        logging.basicConfig(level=logging.NOTSET, force=True)
+    cli.configure_logging(config)
+    isolated_logging.info("file logging active")
+    for handler in isolated_logging.handlers:
+        handler.flush()
 
     assert log_path.exists()
     assert "file logging active" in log_path.read_text(encoding="utf-8")
 
 
-def test_main_configures_info_logging_by_default(tmp_path, monkeypatch) -> None:
-    """INFO logging is enabled when --verbose is not supplied."""
-
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    _install_movie_pipeline(monkeypatch, tmp_path)
-
-    logging.basicConfig(level=logging.NOTSET, force=True)
-    try:
-        exit_code = cli.main([str(device)])
-        assert exit_code == cli.EXIT_SUCCESS
-        assert logging.getLogger().getEffectiveLevel() == logging.INFO
-    finally:
-        logging.basicConfig(level=logging.NOTSET, force=True)
-
-
-def test_main_configures_debug_logging_with_verbose(tmp_path, monkeypatch) -> None:
-    """DEBUG logging is enabled when --verbose is provided."""
+@pytest.mark.parametrize(
+    ("flags", "expected_level"),
+    [([], logging.INFO), (["--verbose"], logging.DEBUG)],
+    ids=["default-info", "verbose-debug"],
+)
+def test_main_configures_logging_level(
+    device, isolated_logging, install_pipeline, flags, expected_level
+) -> None:
+    """INFO logging is the default and --verbose switches the root logger to DEBUG."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
+    install_pipeline()
 
-    _install_movie_pipeline(monkeypatch, tmp_path)
+    exit_code = cli.main([*flags, str(device)])
 
-    logging.basicConfig(level=logging.NOTSET, force=True)
-    try:
-        exit_code = cli.main(["--verbose", str(device)])
-        assert exit_code == cli.EXIT_SUCCESS
-        assert logging.getLogger().getEffectiveLevel() == logging.DEBUG
-    finally:
-        logging.basicConfig(level=logging.NOTSET, force=True)
+    assert exit_code == cli.EXIT_SUCCESS
+    assert isolated_logging.getEffectiveLevel() == expected_level
 
 
-def test_main_simulate_uses_fixture_and_forces_dry_run(tmp_path, monkeypatch) -> None:
+def test_main_simulate_uses_fixture_and_forces_dry_run(tmp_path, install_pipeline) -> None:
     """Simulation mode loads the fixture without touching the device."""
 
     fixture = tmp_path / "simulation.json"
-    fixture.write_text(
-        json.dumps(
-            {
-                "label": "Simulated Disc",
-                "titles": [
-                    {
-                        "label": "Simulated Feature",
-                        "duration": 5400,
-                    }
-                ],
-            }
-        ),
-        encoding="utf-8",
-    )
-
-    events: list[object] = []
+    fixture.write_bytes(_SIMULATION_FIXTURE)
 
     def unexpected_discover():
         raise AssertionError("discover_inspection_tools should not run in simulation mode")
 
-    monkeypatch.setattr(cli, "discover_inspection_tools", unexpected_discover)
-
-    def fake_classify(disc_info: DiscInfo, *, thresholds) -> ClassificationResult:
-        events.append(("classify", disc_info.label))
-        return ClassificationResult("movie", disc_info.titles)
-
-    monkeypatch.setattr(cli, "classify_disc", fake_classify)
-
-    def fake_movie_output_path(
-        title_info: TitleInfo, config: dict[str, object], *, track_index: int = 1
-    ) -> Path:
-        events.append(("movie_output_path", title_info.label))
-        return tmp_path / f"output-{track_index}.mp4"
-
-    monkeypatch.setattr(cli, "movie_output_path", fake_movie_output_path)
-
-    def fake_rip_disc(
-        device: str,
-        classification_value: ClassificationResult,
-        destination_factory,
-        *,
-        dry_run: bool,
-        which=None,
-    ) -> tuple[RipPlan, ...]:
-        events.append(("rip_disc", device, dry_run))
-        destination = destination_factory(classification_value.episodes[0], None, 1)
-        return (
-            RipPlan(
-                device=device,
-                title=classification_value.episodes[0],
-                destination=Path(destination),
-                command=("echo", "rip"),
-                will_execute=not dry_run,
-            ),
-        )
-
-    monkeypatch.setattr(cli, "rip_disc", fake_rip_disc)
-
-    def fake_run(plan: RipPlan):
-        events.append(("run_rip_plan", plan.destination))
-        return None
-
-    monkeypatch.setattr(cli, "run_rip_plan", fake_run)
+    fakes = install_pipeline(
+        discover_inspection_tools=unexpected_discover,
+        classify_disc=lambda disc_info, *, thresholds: ClassificationResult(
+            "movie", disc_info.titles
+        ),
+    )
 
     exit_code = cli.main(["--simulate", str(fixture)])
 
     assert exit_code == cli.EXIT_SUCCESS
-    assert ("classify", "Simulated Disc") in events
-    assert any(event[0] == "rip_disc" and event[2] is True for event in events)
+    assert any(event[0] == "rip_disc" and event[2] is True for event in fakes.events)
+    assert ("movie_output_path", "Simulated Feature") in fakes.event_types
 
 
-def test_main_executes_pipeline(monkeypatch, tmp_path) -> None:
+def test_main_executes_pipeline(tmp_path, device, install_pipeline) -> None:
     """The CLI orchestrates discovery, inspection, planning, and ripping."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    events = _install_movie_pipeline(monkeypatch, tmp_path)
+    fakes = install_pipeline()
 
     exit_code = cli.main([str(device)])
 
     assert exit_code == cli.EXIT_SUCCESS
-    assert events == [
+    assert fakes.events == [
         ("discover", False),
         ("inspect", "lsdvd"),
         ("classify", "Sample Disc"),
@@ -672,31 +690,15 @@ def test_main_executes_pipeline(monkeypatch, tmp_path) -> None:
         ("run_rip_plan", tmp_path / "output-1.mp4"),
         (
             "metadata",
-            [tmp_path / "output-1.mp4"],
+            (tmp_path / "output-1.mp4",),
             False,
         ),
     ]
 
 
-def test_main_propagates_cli_title_override(monkeypatch, tmp_path) -> None:
+def test_main_propagates_cli_title_override(tmp_path, device, install_pipeline) -> None:
     """A manually supplied title is available to the ripping workflow."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    title = TitleInfo(label="Main Feature", duration=timedelta(minutes=95))
-    disc = DiscInfo(label="Sample Disc", titles=(title,))
-    classification = ClassificationResult("movie", (title,))
-    tools = InspectionTools(
-        dvd=ToolAvailability("lsdvd", "/usr/bin/lsdvd"),
-        fallback=None,
-        blu_ray=None,
-    )
-
-    monkeypatch.setattr(cli, "discover_inspection_tools", lambda: tools)
-    monkeypatch.setattr(cli, "inspect_dvd", lambda *_args, **_kwargs: disc)
-    monkeypatch.setattr(cli, "classify_disc", lambda *_args, **_kwargs: classification)
-
     captured_titles: list[str | None] = []
 
     def fake_movie_output_path(
@@ -705,33 +707,7 @@ def test_main_propagates_cli_title_override(monkeypatch, tmp_path) -> None:
         captured_titles.append(config.get("title"))
         return tmp_path / f"output-{track_index}.mp4"
 
-    monkeypatch.setattr(cli, "movie_output_path", fake_movie_output_path)
-
-    def unexpected_series_output_path(*_args, **_kwargs):
-        raise AssertionError("Series output path should not be used for movie plans")
-
-    monkeypatch.setattr(cli, "series_output_path", unexpected_series_output_path)
-
-    def fake_rip_disc(
-        device_path,
-        classification_value,
-        destination_factory,
-        *,
-        dry_run,
-        which=None,
-    ) -> tuple[RipPlan, ...]:
-        destination = destination_factory(classification_value.episodes[0], None, 1)
-        plan = RipPlan(
-            device=device_path,
-            title=classification_value.episodes[0],
-            destination=Path(destination),
-            command=("echo", "rip"),
-            will_execute=not dry_run,
-        )
-        return (plan,)
-
-    monkeypatch.setattr(cli, "rip_disc", fake_rip_disc)
-    monkeypatch.setattr(cli, "run_rip_plan", lambda _plan: None)
+    install_pipeline(movie_output_path=fake_movie_output_path)
 
     exit_code = cli.main(["-t", "The Matrix", str(device)])
 
@@ -739,83 +715,32 @@ def test_main_propagates_cli_title_override(monkeypatch, tmp_path) -> None:
     assert captured_titles == ["The Matrix"]
 
 
-def test_main_uses_fallback_inspector_when_dvd_missing(monkeypatch, tmp_path) -> None:
+def test_main_uses_fallback_inspector_when_dvd_missing(device, install_pipeline) -> None:
     """When :command:`lsdvd` is unavailable, the CLI falls back to ffprobe."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    events = _install_movie_pipeline(monkeypatch, tmp_path, use_fallback=True)
+    fakes = install_pipeline(use_fallback=True)
 
     exit_code = cli.main([str(device)])
 
     assert exit_code == cli.EXIT_SUCCESS
-    assert ("inspect", "ffprobe") in events
+    assert ("inspect", "ffprobe") in fakes.event_types
 
 
-def test_main_honors_dry_run_flag(monkeypatch, tmp_path) -> None:
+def test_main_honors_dry_run_flag(device, install_pipeline) -> None:
     """The CLI propagates the dry-run flag down to the ripping plans."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    events = _install_movie_pipeline(monkeypatch, tmp_path, dry_run=True)
+    fakes = install_pipeline(dry_run=True)
 
     exit_code = cli.main(["--dry-run", str(device)])
 
     assert exit_code == cli.EXIT_SUCCESS
-    assert ("rip_disc", str(device), True) in events
+    assert ("rip_disc", str(device), True) in fakes.event_types
 
 
-def test_main_dry_run_prints_plan(monkeypatch, tmp_path, capsys) -> None:
+def test_main_dry_run_prints_plan(device, capsys, install_pipeline) -> None:
     """Dry-run mode reports the planned commands instead of executing them."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    title = TitleInfo(label="Main Feature", duration=timedelta(minutes=95))
-    disc = DiscInfo(label="Sample Disc", titles=(title,))
-    classification = ClassificationResult("movie", (title,))
-
-    tools = InspectionTools(
-        dvd=ToolAvailability("lsdvd", "/usr/bin/lsdvd"),
-        fallback=None,
-        blu_ray=None,
-    )
-
-    monkeypatch.setattr(cli, "discover_inspection_tools", lambda: tools)
-    monkeypatch.setattr(cli, "inspect_dvd", lambda *_args, **_kwargs: disc)
-    monkeypatch.setattr(cli, "classify_disc", lambda *_args, **_kwargs: classification)
-    monkeypatch.setattr(
-        cli,
-        "movie_output_path",
-        lambda *_args, **_kwargs: tmp_path / "planned.mp4",
-    )
-    def unexpected_series_path(*_args, **_kwargs):
-        raise AssertionError("Series output path should not be used for movie plans")
-
-    monkeypatch.setattr(cli, "series_output_path", unexpected_series_path)
-
-    def fake_rip_disc(
-        device_path,
-        classification_value,
-        destination_factory,
-        *,
-        dry_run,
-        which=None,
-    ) -> tuple[RipPlan, ...]:
-        destination = destination_factory(classification_value.episodes[0], None, 1)
-        return (
-            RipPlan(
-                device=device_path,
-                title=classification_value.episodes[0],
-                destination=destination,
-                command=("echo", "rip"),
-                will_execute=not dry_run,
-            ),
-        )
-
-    monkeypatch.setattr(cli, "rip_disc", fake_rip_disc)
+    install_pipeline(dry_run=True, run_rip_plan=cli.run_rip_plan)
 
     exit_code = cli.main(["--dry-run", str(device)])
 
@@ -826,27 +751,10 @@ def test_main_dry_run_prints_plan(monkeypatch, tmp_path, capsys) -> None:
 
 
 def test_main_writes_metadata_json_for_successful_plan(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    tmp_path, device: Path, install_pipeline
 ) -> None:
     """A full run writes metadata JSON using the rip results."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    title = TitleInfo(label="Main Feature", duration=timedelta(minutes=95))
-    disc = DiscInfo(label="Sample Disc", titles=(title,))
-    classification = ClassificationResult("movie", (title,))
-
-    tools = InspectionTools(
-        dvd=ToolAvailability("lsdvd", "/usr/bin/lsdvd"),
-        fallback=None,
-        blu_ray=None,
-    )
-
-    monkeypatch.setattr(cli, "discover_inspection_tools", lambda: tools)
-    monkeypatch.setattr(cli, "inspect_dvd", lambda *_args, **_kwargs: disc)
-    monkeypatch.setattr(cli, "classify_disc", lambda *_args, **_kwargs: classification)
-
     destination = tmp_path / "library" / "custom_track01.mp4"
 
     def fake_movie_output_path(
@@ -855,41 +763,11 @@ def test_main_writes_metadata_json_for_successful_plan(
         assert track_index == 1
         return destination
 
-    monkeypatch.setattr(cli, "movie_output_path", fake_movie_output_path)
-
-    def unexpected_series_output_path(*_args, **_kwargs):  # pragma: no cover - guard
-        raise AssertionError("Series output path should not be used for movie plan")
-
-    monkeypatch.setattr(cli, "series_output_path", unexpected_series_output_path)
-
-    def fake_rip_disc(
-        device_path,
-        classification_value,
-        destination_factory,
-        *,
-        dry_run,
-        which=None,
-    ) -> tuple[RipPlan, ...]:
-        assert dry_run is False
-        resolved = destination_factory(classification_value.episodes[0], None, 1)
-        plan = RipPlan(
-            device=str(device_path),
-            title=classification_value.episodes[0],
-            destination=Path(resolved),
-            command=("ffmpeg", "-i", str(device_path), str(resolved)),
-            will_execute=True,
-        )
-        return (plan,)
-
-    monkeypatch.setattr(cli, "rip_disc", fake_rip_disc)
-
     def fake_run_rip_plan(plan: RipPlan):
         plan.destination.parent.mkdir(parents=True, exist_ok=True)
         plan.destination.write_bytes(b"video")
         return None
 
-    monkeypatch.setattr(cli, "run_rip_plan", fake_run_rip_plan)
-
     original_builder = cli.build_metadata_document
 
     def build_metadata_document(
@@ -917,7 +795,12 @@ def test_main_writes_metadata_json_for_successful_plan(
             now=lambda: datetime(2024, 9, 1, tzinfo=timezone.utc),
         )
 
-    monkeypatch.setattr(cli, "build_metadata_document", build_metadata_document)
+    install_pipeline(
+        movie_output_path=fake_movie_output_path,
+        run_rip_plan=fake_run_rip_plan,
+        _emit_metadata_document=cli._emit_metadata_document,
+        build_metadata_document=build_metadata_document,
+    )
 
     exit_code = cli.main([str(device)])
 
@@ -946,14 +829,11 @@ def test_main_writes_metadata_json_for_successful_plan(
 
 
 def test_main_uses_series_output_paths_for_series_classification(
-    monkeypatch, tmp_path
+    device, install_pipeline
 ) -> None:
     """Series classifications use the series naming helpers for destinations."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    events = _install_series_pipeline(monkeypatch, tmp_path)
+    fakes = install_pipeline("series")
 
     exit_code = cli.main([str(device)])
 
@@ -964,53 +844,44 @@ def test_main_uses_series_output_paths_for_series_classification(
         "s01e01",
         "Episode One",
         1,
-    ) in events
+    ) in fakes.event_types
     assert (
         "series_output_path",
         "Sample Series",
         "s01e02",
         "Episode Two",
         2,
-    ) in events
-    run_events = [event for event in events if event[0] == "run_rip_plan"]
+    ) in fakes.event_types
+    run_events = [event for event in fakes.events if event[0] == "run_rip_plan"]
     assert [entry[2] for entry in run_events] == ["s01e01", "s01e02"]
 
 
-def test_main_logs_structured_classification_summary(monkeypatch, tmp_path) -> None:
+def test_main_logs_structured_classification_summary(
+    device, caplog, install_pipeline
+) -> None:
     """Classification results are emitted as structured log messages."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    _install_series_pipeline(monkeypatch, tmp_path)
-
-    messages: list[str] = []
+    install_pipeline("series")
 
-    class _RecordingHandler(logging.Handler):
-        def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - simple
-            messages.append(record.getMessage())
-
-    handler: logging.Handler = _RecordingHandler(level=logging.INFO)
-    cli.logger.addHandler(handler)
+    # cli.main() reconfigures the root logger with force=True, which detaches
+    # caplog's root handler, so attach the capture handler to the CLI logger.
+    cli.logger.addHandler(caplog.handler)
     try:
         exit_code = cli.main([str(device)])
     finally:
-        cli.logger.removeHandler(handler)
+        cli.logger.removeHandler(caplog.handler)
 
     assert exit_code == cli.EXIT_SUCCESS
     assert (
         "EVENT=CLASSIFIED TYPE=series EPISODES=2 LABEL=\"Sample Series\""
-        in messages
+        in caplog.messages
     )
 
 
-def test_main_logs_fallback_title_selection(monkeypatch, tmp_path, capsys) -> None:
+def test_main_logs_fallback_title_selection(device, capsys, install_pipeline) -> None:
     """When no title override is provided the fallback title is announced."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    _install_movie_pipeline(monkeypatch, tmp_path)
+    install_pipeline()
 
     exit_code = cli.main([str(device)])
 
@@ -1022,18 +893,13 @@ def test_main_logs_fallback_title_selection(monkeypatch, tmp_path, capsys) -> No
     )
 
 
-def test_main_returns_rip_failure_exit_code(monkeypatch, tmp_path, capsys) -> None:
+def test_main_returns_rip_failure_exit_code(device, capsys, install_pipeline) -> None:
     """When ripping fails the CLI surfaces the message and exit code 2."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    _install_movie_pipeline(monkeypatch, tmp_path)
-
     def failing_run(_plan: RipPlan):
         raise RipExecutionError("command failed", exit_code=cli.EXIT_RIP_FAILED)
 
-    monkeypatch.setattr(cli, "run_rip_plan", failing_run)
+    install_pipeline(run_rip_plan=failing_run)
 
     exit_code = cli.main([str(device)])
 
@@ -1048,7 +914,7 @@ def test_execute_rip_plans_propagates_rip_exit_code(monkeypatch, tmp_path) -> No
 
     plan = RipPlan(
         device="/dev/sr0",
-        title=TitleInfo(label="Sample", duration=timedelta(minutes=5)),
+        title=_SAMPLE_TITLE,
         destination=tmp_path / "sample.mp4",
         command=("echo", "rip"),
         will_execute=False,
@@ -1069,7 +935,7 @@ def test_execute_rip_plans_handles_unexpected_exception(monkeypatch, tmp_path, c
 
     plan = RipPlan(
         device="/dev/sr0",
-        title=TitleInfo(label="Sample", duration=timedelta(minutes=5)),
+        title=_SAMPLE_TITLE,
         destination=tmp_path / "sample.mp4",
         command=("echo", "rip"),
         will_execute=False,
@@ -1086,13 +952,24 @@ def test_execute_rip_plans_handles_unexpected_exception(monkeypatch, tmp_path, c
     assert "Unexpected ripping failure" in capsys.readouterr().err
 
 
+def _compress_plan_message(caplog: pytest.LogCaptureFixture) -> str:
+    """Return the first COMPRESS_PLAN message, formatting only the matching record."""
+
+    return next(
+        record.getMessage()
+        for record in caplog.records
+        if record.name == cli.logger.name
+        and str(record.msg).startswith("EVENT=COMPRESS_PLAN")
+    )
+
+
 def test_execute_rip_plans_emits_compression_plan(monkeypatch, tmp_path, caplog) -> None:
     """When compression is enabled a HandBrake plan is logged for each rip."""
 
     destination = tmp_path / "sample.mp4"
     plan = RipPlan(
         device="/dev/sr0",
-        title=TitleInfo(label="Sample", duration=timedelta(minutes=5)),
+        title=_SAMPLE_TITLE,
         destination=destination,
         command=("echo", "rip"),
         will_execute=True,
@@ -1100,7 +977,7 @@ def test_execute_rip_plans_emits_compression_plan(monkeypatch, tmp_path, caplog)
 
     def fake_run(_plan: RipPlan) -> CompletedProcess[str]:
         destination.write_bytes(b"data")
-        return CompletedProcess(plan.command, 0)
+        return _RIP_COMPLETED
 
     monkeypatch.setattr(cli, "run_rip_plan", fake_run)
 
@@ -1108,7 +985,7 @@ def test_execute_rip_plans_emits_compression_plan(monkeypatch, tmp_path, caplog)
         exit_code = cli._execute_rip_plans((plan,), enable_compression=True)
 
     assert exit_code == cli.EXIT_SUCCESS
-    message = next(msg for msg in caplog.messages if "EVENT=COMPRESS_PLAN" in msg)
+    message = _compress_plan_message(caplog)
     assert "STATUS=ready" in message
     assert str(destination) in message
     assert "HandBrakeCLI" in message
@@ -1122,7 +999,7 @@ def test_execute_rip_plans_marks_dry_run_compression(monkeypatch, tmp_path, capl
     destination = tmp_path / "sample.mp4"
     plan = RipPlan(
         device="/dev/sr0",
-        title=TitleInfo(label="Sample", duration=timedelta(minutes=5)),
+        title=_SAMPLE_TITLE,
         destination=destination,
         command=("echo", "rip"),
         will_execute=False,
@@ -1137,27 +1014,20 @@ def test_execute_rip_plans_marks_dry_run_compression(monkeypatch, tmp_path, capl
         exit_code = cli._execute_rip_plans((plan,), enable_compression=True)
 
     assert exit_code == cli.EXIT_SUCCESS
-    message = next(msg for msg in caplog.messages if "EVENT=COMPRESS_PLAN" in msg)
+    message = _compress_plan_message(caplog)
     assert "STATUS=dry-run" in message
     assert str(destination) in message
 
 
 def test_main_maps_bluray_errors_to_disc_not_detected(
-    monkeypatch, tmp_path, capsys
+    monkeypatch, device, capsys
 ) -> None:
     """Blu-ray support errors are treated as disc detection failures."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
     monkeypatch.setattr(
         cli,
         "discover_inspection_tools",
-        lambda: InspectionTools(
-            dvd=ToolAvailability("lsdvd", "/usr/bin/lsdvd"),
-            fallback=None,
-            blu_ray=None,
-        ),
+        lambda: _MOVIE_TOOLS_DVD,
     )
 
     def raise_bluray(*_args, **_kwargs):
@@ -1171,16 +1041,10 @@ def test_main_maps_bluray_errors_to_disc_not_detected(
     assert "Blu-ray not supported" in capsys.readouterr().err
 
 
-def test_main_errors_when_no_inspection_tools(monkeypatch, tmp_path, capsys) -> None:
+def test_main_errors_when_no_inspection_tools(monkeypatch, device, capsys) -> None:
     """A helpful error is shown when neither lsdvd nor ffprobe are available."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    def fake_discover() -> InspectionTools:
-        return InspectionTools(dvd=None, fallback=None, blu_ray=None)
-
-    monkeypatch.setattr(cli, "discover_inspection_tools", fake_discover)
+    monkeypatch.setattr(cli, "discover_inspection_tools", lambda: _NO_TOOLS)
 
     exit_code = cli.main([str(device)])
 
@@ -1201,12 +1065,9 @@ def test_main_errors_when_device_missing(capsys) -> None:
     assert "Error: device path '/path/that/does/not/exist'" in captured.err
 
 
-def test_main_errors_when_device_unreadable(tmp_path, capsys, monkeypatch) -> None:
+def test_main_errors_when_device_unreadable(device, capsys, monkeypatch) -> None:
     """The CLI refuses to proceed if the device exists but lacks read access."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
     monkeypatch.setattr(cli.os, "access", lambda *_: False)
 
     code = cli.main([str(device)])
@@ -1217,20 +1078,13 @@ def test_main_errors_when_device_unreadable(tmp_path, capsys, monkeypatch) -> No
     assert f"Error: device path '{device}'" in captured.err
 
 
-def test_main_hides_traceback_for_unexpected_errors(
-    tmp_path, monkeypatch, capsys
-) -> None:
+def test_main_hides_traceback_for_unexpected_errors(device, capsys, install_pipeline) -> None:
     """Unexpected exceptions are converted into a friendly error message."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
-
-    _install_movie_pipeline(monkeypatch, tmp_path)
-
     def raise_unexpected(*_args, **_kwargs):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(cli, "classify_disc", raise_unexpected)
+    install_pipeline(classify_disc=raise_unexpected)
 
     code = cli.main([str(device)])
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -7,16 +8,65 @@ import pytest
 from discripper import config
 
 
-def test_load_config_returns_defaults_when_file_missing(tmp_path: Path) -> None:
-    missing_path = tmp_path / "missing.yaml"
+@pytest.fixture(scope="module")
+def config_scratch(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("config_scratch")
 
-    loaded = config.load_config(missing_path)
+
+@pytest.fixture
+def config_file(config_scratch: Path, request: pytest.FixtureRequest) -> Path:
+    """Return a not-yet-created config path unique to the requesting test."""
+
+    return config_scratch / f"{request.node.name}.yaml"
+
+
+def test_load_config_returns_defaults_when_file_missing(config_file: Path) -> None:
+    loaded = config.load_config(config_file)
 
     assert loaded == config.DEFAULT_CONFIG
 
 
-def test_load_config_overrides_defaults(tmp_path: Path) -> None:
-    config_file = tmp_path / "config.yaml"
+def test_clone_default_config_returns_independent_copy() -> None:
+    clone = config.clone_default_config()
+
+    assert clone == config.DEFAULT_CONFIG
+    clone["naming"]["separator"] = "-"
+    assert config.DEFAULT_CONFIG["naming"]["separator"] == "_"
+
+
+def test_defaults_come_from_one_source_with_or_without_file(
+    config_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(config.DEFAULT_CONFIG["naming"], "separator", "-")
+
+    without_file = config.load_config(config_file)
+    config_file.write_text("dry_run: true\n", encoding="utf-8")
+    with_file = config.load_config(config_file)
+
+    assert without_file["naming"]["separator"] == "-"
+    assert with_file["naming"]["separator"] == "-"
+
+
+def test_load_config_validates_current_defaults(
+    config_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config.load_config(config_file)
+    monkeypatch.setitem(config.DEFAULT_CONFIG["naming"], "separator", 5)
+
+    with pytest.raises(ValueError, match="naming.separator"):
+        config.load_config(config_file)
+
+
+def test_merge_config_copies_nested_lists() -> None:
+    base = {"naming": {"aliases": [["a"], "b"]}}
+
+    merged = config._merge_config(base, {"naming": {"lowercase": True}})
+    merged["naming"]["aliases"][0].append("c")
+
+    assert base["naming"]["aliases"] == [["a"], "b"]
+
+
+def test_load_config_overrides_defaults(config_file: Path) -> None:
     config_file.write_text(
         "output_directory: /mnt/media\n" "naming:\n" "  lowercase: true\n"
     )
@@ -28,45 +78,85 @@ def test_load_config_overrides_defaults(tmp_path: Path) -> None:
     assert loaded["naming"]["separator"] == config.DEFAULT_CONFIG["naming"]["separator"]
 
 
-def test_load_config_respects_logging_file(tmp_path: Path) -> None:
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text(
-        "logging:\n" "  level: DEBUG\n" "  file: /var/log/discripper.log\n",
-        encoding="utf-8",
-    )
+def test_load_config_returns_independent_copies(config_file: Path) -> None:
+    config_file.write_text("naming:\n  lowercase: true\n", encoding="utf-8")
 
-    loaded = config.load_config(config_file)
+    first = config.load_config(config_file)
+    first["naming"]["lowercase"] = False
 
-    assert loaded["logging"]["level"] == "DEBUG"
-    assert loaded["logging"]["file"] == "/var/log/discripper.log"
+    assert config.load_config(config_file)["naming"]["lowercase"] is True
 
 
-def test_load_config_rejects_non_mapping(tmp_path: Path) -> None:
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text("[]")
+def test_load_config_rereads_modified_file(config_file: Path) -> None:
+    config_file.write_text("output_directory: /mnt/a\n", encoding="utf-8")
+    assert config.load_config(config_file)["output_directory"] == "/mnt/a"
 
-    with pytest.raises(ValueError):
-        config.load_config(config_file)
+    config_file.write_text("output_directory: /mnt/media\n", encoding="utf-8")
 
+    assert config.load_config(config_file)["output_directory"] == "/mnt/media"
 
-def test_load_config_validates_schema_types(tmp_path: Path) -> None:
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text("compression: 1\n")
 
-    with pytest.raises(ValueError, match="compression"):
-        config.load_config(config_file)
+def test_load_config_rereads_same_size_rewrite(config_file: Path) -> None:
+    config_file.write_text("output_directory: /mnt/a\n", encoding="utf-8")
+    assert config.load_config(config_file)["output_directory"] == "/mnt/a"
+    original = config_file.stat()
+
+    config_file.write_text("output_directory: /mnt/b\n", encoding="utf-8")
+    os.utime(config_file, ns=(original.st_atime_ns, original.st_mtime_ns + 1_000_000_000))
+
+    assert config_file.stat().st_size == original.st_size
+    assert config.load_config(config_file)["output_directory"] == "/mnt/b"
+
+
+def test_clear_cache_rereads_rewrite_with_identical_stat(config_file: Path) -> None:
+    config_file.write_text("output_directory: /mnt/a\n", encoding="utf-8")
+    assert config.load_config(config_file)["output_directory"] == "/mnt/a"
+    original = config_file.stat()
+
+    config_file.write_text("output_directory: /mnt/b\n", encoding="utf-8")
+    os.utime(config_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+    config.clear_cache()
+
+    assert config.load_config(config_file)["output_directory"] == "/mnt/b"
+
 
+def test_load_config_decodes_utf8_content(config_file: Path) -> None:
+    config_file.write_text("output_directory: /mnt/Vidéos\n", encoding="utf-8")
+
+    assert config.load_config(config_file)["output_directory"] == "/mnt/Vidéos"
+
+
+def test_load_config_respects_logging_file(config_file: Path) -> None:
+    config_file.write_text(
+        "logging:\n" "  level: DEBUG\n" "  file: /var/log/discripper.log\n",
+        encoding="utf-8",
+    )
+
+    loaded = config.load_config(config_file)
+
+    assert loaded["logging"]["level"] == "DEBUG"
+    assert loaded["logging"]["file"] == "/var/log/discripper.log"
 
-def test_load_config_validates_nested_schema(tmp_path: Path) -> None:
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text("naming: lowercase\n")
 
-    with pytest.raises(ValueError, match="naming"):
+@pytest.mark.parametrize(
+    ("content", "match"),
+    [
+        ("[]", "mapping"),
+        ("compression: 1\n", "compression"),
+        ("naming: lowercase\n", "naming"),
+    ],
+    ids=["non-mapping", "schema-type", "nested-schema"],
+)
+def test_load_config_rejects_invalid_documents(
+    config_file: Path, content: str, match: str
+) -> None:
+    config_file.write_text(content)
+
+    with pytest.raises(ValueError, match=match):
         config.load_config(config_file)
 
 
-def test_load_config_overrides_metadata_and_patterns(tmp_path: Path) -> None:
-    config_file = tmp_path / "config.yaml"
+def test_load_config_overrides_metadata_and_patterns(config_file: Path) -> None:
     config_file.write_text(
         "metadata:\n"
         "  placement: output-root\n"
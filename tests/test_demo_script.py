@@ -4,9 +4,40 @@ import os
 import subprocess
 from pathlib import Path
 
+import pytest
 
+from discripper import cli, config as config_module
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_DEMO_FIXTURES = ("simulated_movie.json", "simulated_series.json")
+
+
+@pytest.mark.parametrize("fixture_name", _DEMO_FIXTURES)
+def test_demo_simulations_dry_run_in_process(
+    fixture_name: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys,
+    isolated_logging,
+) -> None:
+    """Run the same simulations as ``scripts/demo.sh`` without spawning a shell."""
+
+    ffmpeg_stub = tmp_path / "ffmpeg"
+    ffmpeg_stub.write_text("#!/bin/sh\nexit 0\n", encoding="utf-8")
+    ffmpeg_stub.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setattr(config_module, "CONFIG_PATH", tmp_path / "missing.yaml")
+
+    fixture = _REPO_ROOT / "samples" / fixture_name
+    exit_code = cli.main(["--simulate", str(fixture), "--dry-run"])
+
+    assert exit_code == cli.EXIT_SUCCESS
+    assert "[dry-run]" in capsys.readouterr().out
+
+
+@pytest.mark.slow
 def test_demo_script_runs_successfully() -> None:
-    script_path = Path(__file__).resolve().parents[1] / "scripts" / "demo.sh"
+    script_path = _REPO_ROOT / "scripts" / "demo.sh"
     assert script_path.exists(), "demo.sh must exist for the demo task"
 
     env = os.environ.copy()
@@ -4,8 +4,13 @@ import re
 from collections.abc import Mapping
 from pathlib import Path
 
+import pytest
+
 from discripper import config
 
+_HOME = str(Path.home())
+_TABLE_ROW_RE = re.compile(r"^\|.*$", re.MULTILINE)
+
 
 def _flatten(mapping: Mapping[str, object], prefix: str = ""):
     for key, value in mapping.items():
@@ -22,15 +27,20 @@ def _format_default(value: object) -> str:
     if isinstance(value, (int, float)):
         return str(value)
     if isinstance(value, str):
-        home = str(Path.home())
-        if home and value.startswith(home):
-            remainder = value[len(home) :].lstrip("/")
+        if _HOME and value.startswith(_HOME):
+            remainder = value[len(_HOME) :].lstrip("/")
             return f"~/{remainder}" if remainder else "~"
         return value
     return str(value)
 
 
-def test_readme_defaults_table_matches_defaults() -> None:
+_FLAT_DEFAULTS = tuple(_flatten(config.DEFAULT_CONFIG))
+
+
+@pytest.fixture(scope="module")
+def readme_defaults() -> dict[str, str]:
+    """Parse the README "Defaults & overrides" table into ``{setting: default}``."""
+
     readme = Path("README.md").read_text(encoding="utf-8")
     parts = readme.split("### Defaults & overrides", maxsplit=1)
     assert len(parts) == 2, "Defaults & overrides section missing"
@@ -39,7 +49,7 @@ def test_readme_defaults_table_matches_defaults() -> None:
     if "###" in section:
         section = section.split("###", maxsplit=1)[0]
 
-    table_block = re.findall(r"^\|.*$", section, flags=re.MULTILINE)
+    table_block = _TABLE_ROW_RE.findall(section)
     assert table_block, "Defaults & overrides table is missing"
 
     lines = [line.strip() for line in table_block]
@@ -53,13 +63,18 @@ def test_readme_defaults_table_matches_defaults() -> None:
         if setting in {"Setting", ""}:
             continue
         table_defaults[setting] = default_cell.strip("`")
+    return table_defaults
+
+
+def test_readme_defaults_table_matches_defaults(readme_defaults: dict[str, str]) -> None:
+    table_defaults = readme_defaults
 
     expected_config_path = str(config.CONFIG_PATH)
     assert (
         table_defaults.get("Configuration file path") == expected_config_path
     ), "Configuration file path row mismatch"
 
-    for path, value in _flatten(config.DEFAULT_CONFIG):
+    for path, value in _FLAT_DEFAULTS:
         formatted = _format_default(value)
         assert path in table_defaults, f"Missing defaults row for {path}"
         assert (
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from types import SimpleNamespace
+from subprocess import CompletedProcess
 
 import pytest
 
@@ -110,7 +110,7 @@ def test_inspect_dvd_parses_disc_information(dvd_tool: ToolAvailability) -> None
 
     def fake_runner(args, **kwargs):
         calls.append(args)
-        return SimpleNamespace(stdout=SAMPLE_LSDVD_OUTPUT, stderr="")
+        return CompletedProcess(args, 0, stdout=SAMPLE_LSDVD_OUTPUT, stderr="")
 
     disc = inspect_dvd("/dev/sr0", tool=dvd_tool, runner=fake_runner)
 
@@ -130,7 +130,7 @@ def test_inspect_dvd_parses_disc_information(dvd_tool: ToolAvailability) -> None
 
 def test_inspect_dvd_errors_on_unexpected_output(dvd_tool: ToolAvailability) -> None:
     def fake_runner(args, **kwargs):
-        return SimpleNamespace(stdout="unexpected", stderr="")
+        return CompletedProcess(args, 0, stdout="unexpected", stderr="")
 
     with pytest.raises(ValueError):
         inspect_dvd("/dev/sr0", tool=dvd_tool, runner=fake_runner)
@@ -140,7 +140,7 @@ def test_inspect_dvd_parses_lsdvd_wrapper_payload(
     dvd_tool: ToolAvailability,
 ) -> None:
     def fake_runner(args, **kwargs):
-        return SimpleNamespace(stdout=SAMPLE_LSDVD_WRAPPER_OUTPUT, stderr="")
+        return CompletedProcess(args, 0, stdout=SAMPLE_LSDVD_WRAPPER_OUTPUT, stderr="")
 
     disc = inspect_dvd("/dev/sr0", tool=dvd_tool, runner=fake_runner)
 
@@ -152,7 +152,7 @@ def test_inspect_dvd_accepts_wrapper_without_disc(
     dvd_tool: ToolAvailability, lsdvd_output_without_disc: str
 ) -> None:
     def fake_runner(args, **kwargs):
-        return SimpleNamespace(stdout=lsdvd_output_without_disc, stderr="")
+        return CompletedProcess(args, 0, stdout=lsdvd_output_without_disc, stderr="")
 
     disc = inspect_dvd("/dev/sr0", tool=dvd_tool, runner=fake_runner)
 
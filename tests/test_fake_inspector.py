@@ -6,6 +6,8 @@ from pathlib import Path
 
 from discripper.core.fake import inspect_from_fixture
 
+_SAMPLES_DIR = Path(__file__).resolve().parents[1] / "samples"
+
 
 def test_inspect_from_fixture_loads_sample_fixture() -> None:
     disc = inspect_from_fixture("sample_disc")
@@ -94,15 +96,25 @@ def test_inspect_from_fixture_accepts_custom_directory(tmp_path: Path) -> None:
     )
 
 
-def test_simulation_samples_are_available() -> None:
-    samples_dir = Path(__file__).resolve().parents[1] / "samples"
+def test_inspect_from_fixture_reloads_modified_fixture(tmp_path: Path) -> None:
+    fixture_path = tmp_path / "custom.json"
+    fixture_path.write_text(json.dumps({"label": "First"}), encoding="utf-8")
+
+    first = inspect_from_fixture("custom", fixture_dir=tmp_path)
+    assert inspect_from_fixture("custom", fixture_dir=tmp_path) is first
 
-    movie_disc = inspect_from_fixture("simulated_movie", fixture_dir=samples_dir)
+    fixture_path.write_text(json.dumps({"label": "Second Disc"}), encoding="utf-8")
+
+    assert inspect_from_fixture("custom", fixture_dir=tmp_path).label == "Second Disc"
+
+
+def test_simulation_samples_are_available() -> None:
+    movie_disc = inspect_from_fixture("simulated_movie", fixture_dir=_SAMPLES_DIR)
     assert movie_disc.label == "Simulation: Feature Film"
     assert len(movie_disc.titles) == 2
     assert movie_disc.titles[0].label == "Main Feature"
 
-    series_disc = inspect_from_fixture("simulated_series", fixture_dir=samples_dir)
+    series_disc = inspect_from_fixture("simulated_series", fixture_dir=_SAMPLES_DIR)
     assert series_disc.label == "Simulation: Limited Series"
     assert len(series_disc.titles) == 4
     assert series_disc.titles[0].label == "Episode 1"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from datetime import timedelta
+from subprocess import CompletedProcess
 
 import pytest
 
@@ -10,13 +11,6 @@ from discripper.core.discovery import ToolAvailability
 from discripper.core.ffprobe import inspect_with_ffprobe
 
 
-class DummyCompletedProcess:
-    def __init__(self, args: list[str], stdout: str) -> None:
-        self.args = args
-        self.returncode = 0
-        self.stdout = stdout
-
-
 @pytest.fixture()
 def ffprobe_tool() -> ToolAvailability:
     return ToolAvailability(command="ffprobe", path="/usr/bin/ffprobe")
@@ -34,7 +28,7 @@ def test_inspect_with_ffprobe_parses_title_and_duration(ffprobe_tool: ToolAvaila
 
     def runner(command, check, stdout=None, stderr=None, text=None):  # type: ignore[override]
         captured_command.extend(command)
-        return DummyCompletedProcess(command, ffprobe_output)
+        return CompletedProcess(command, 0, stdout=ffprobe_output, stderr="")
 
     disc = inspect_with_ffprobe("/dev/sr0", tool=ffprobe_tool, runner=runner)
 
@@ -63,7 +57,7 @@ def test_inspect_with_ffprobe_handles_missing_fields(ffprobe_tool: ToolAvailabil
     ffprobe_output = json.dumps({"format": {}})
 
     def runner(command, check, stdout=None, stderr=None, text=None):  # type: ignore[override]
-        return DummyCompletedProcess(command, ffprobe_output)
+        return CompletedProcess(command, 0, stdout=ffprobe_output, stderr="")
 
     disc = inspect_with_ffprobe("/dev/sr0", tool=ffprobe_tool, runner=runner)
 
@@ -76,7 +70,7 @@ def test_inspect_with_ffprobe_handles_missing_fields(ffprobe_tool: ToolAvailabil
 
 def test_inspect_with_ffprobe_rejects_non_json(ffprobe_tool: ToolAvailability) -> None:
     def runner(command, check, stdout=None, stderr=None, text=None):  # type: ignore[override]
-        return DummyCompletedProcess(command, "not-json")
+        return CompletedProcess(command, 0, stdout="not-json", stderr="")
 
     with pytest.raises(ValueError):
         inspect_with_ffprobe("/dev/sr0", tool=ffprobe_tool, runner=runner)
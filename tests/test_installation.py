@@ -6,6 +6,7 @@ import importlib.util
 import os
 import subprocess
 import sys
+import venv
 from pathlib import Path
 
 import pytest
@@ -19,30 +20,52 @@ def _bin_dir(venv_dir: Path) -> Path:
     return venv_dir / "bin"
 
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_REUSED_VENV_DIR = Path.home() / ".cache" / "discripper-tests" / "pip-venv"
+
+
 def _run(cmd: list[str], *, env: dict[str, str] | None = None) -> subprocess.CompletedProcess[str]:
     """Execute a command and return the completed process."""
 
+    run_env = dict(os.environ if env is None else env)
+    run_env.setdefault("PIP_DISABLE_PIP_VERSION_CHECK", "1")
+    run_env.setdefault("PIP_NO_INPUT", "1")
     return subprocess.run(
         cmd,
         check=True,
         capture_output=True,
         text=True,
-        env=env,
+        env=run_env,
     )
 
 
+@pytest.fixture(scope="session")
+def pip_venv(tmp_path_factory: pytest.TempPathFactory, pytestconfig: pytest.Config) -> Path:
+    """Return a virtual environment with an up-to-date pip.
+
+    With ``--reuse-venv`` the environment is kept under ``~/.cache`` and only
+    created on the first run.
+    """
+
+    if pytestconfig.getoption("reuse_venv"):
+        venv_dir = _REUSED_VENV_DIR
+        if (_bin_dir(venv_dir) / "python").exists():
+            return venv_dir
+    else:
+        venv_dir = tmp_path_factory.mktemp("pip-venv")
+
+    venv.EnvBuilder(with_pip=True, symlinks=os.name != "nt").create(venv_dir)
+    _run([str(_bin_dir(venv_dir) / "python"), "-m", "pip", "install", "--upgrade", "pip"])
+    return venv_dir
+
+
 @pytest.mark.slow
-def test_editable_install_via_pip_and_pipx(tmp_path: Path) -> None:
+def test_editable_install_via_pip_and_pipx(tmp_path: Path, pip_venv: Path) -> None:
     """Editable installs via pip and pipx expose the CLI entry point."""
 
-    repo_root = Path(__file__).resolve().parents[1]
-
     # pip install -e . in an isolated virtual environment
-    pip_venv = tmp_path / "pip-venv"
-    _run([sys.executable, "-m", "venv", str(pip_venv)])
     pip_python = _bin_dir(pip_venv) / "python"
-    _run([str(pip_python), "-m", "pip", "install", "--upgrade", "pip"])
-    _run([str(pip_python), "-m", "pip", "install", "--editable", str(repo_root)])
+    _run([str(pip_python), "-m", "pip", "install", "--editable", str(_REPO_ROOT)])
     pip_cli = _bin_dir(pip_venv) / "discripper"
     pip_help = _run([str(pip_cli), "--help"])
     assert pip_help.stdout.lower().startswith("usage:"), pip_help.stdout
@@ -61,7 +84,7 @@ def test_editable_install_via_pip_and_pipx(tmp_path: Path) -> None:
     )
 
     pipx_command = [sys.executable, "-m", "pipx"]
-    _run(pipx_command + ["install", "--editable", str(repo_root)], env=pipx_env)
+    _run(pipx_command + ["install", "--editable", str(_REPO_ROOT)], env=pipx_env)
     pipx_cli = Path(pipx_env["PIPX_BIN_DIR"]) / "discripper"
     pipx_help = _run([str(pipx_cli), "--help"], env=pipx_env)
     assert pipx_help.stdout.lower().startswith("usage:"), pipx_help.stdout
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from subprocess import CompletedProcess
 
+import pytest
+
 from discripper.core import ClassificationResult, DiscInfo, RipPlan, TitleInfo
+from discripper.core import metadata_json
 from discripper.core.metadata_json import build_metadata_document, write_metadata_document
 
 
@@ -79,6 +84,7 @@ def test_build_metadata_document_includes_streams(tmp_path: Path) -> None:
         now=lambda: datetime(2024, 1, 1, tzinfo=timezone.utc),
     )
 
+    assert document["generated_at"] == "2024-01-01T00:00:00+00:00"
     assert document["disc"] == {"label": "Sample Disc", "id": None}
     assert document["title"] == "The Matrix"
     assert document["classification"]["type"] == "movie"
@@ -124,6 +130,45 @@ def test_build_metadata_document_without_ffprobe(tmp_path: Path) -> None:
     assert document["tools"]["ffmpeg"].startswith("ffmpeg version test")
 
 
+def test_build_metadata_document_probes_default_tool_versions_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    title = TitleInfo(label="Episode", duration=timedelta(minutes=42))
+    disc = DiscInfo(label="Series Disc", titles=(title,))
+    classification = ClassificationResult("series", (title,), ("s01e01",))
+    destination = tmp_path / "series" / "series_track01.mp4"
+    plan = RipPlan(
+        device="/dev/sr0",
+        title=title,
+        destination=destination,
+        command=("discripper-probe-tool", "-i", "/dev/sr0", str(destination)),
+        will_execute=True,
+    )
+
+    probed: list[str] = []
+
+    def probe_version(tool: str, *, runner) -> str:
+        probed.append(tool)
+        return f"{tool} 1.0"
+
+    monkeypatch.setattr(metadata_json, "_probe_version", probe_version)
+    metadata_json._default_tool_version.cache_clear()
+    try:
+        for _ in range(2):
+            document = build_metadata_document(
+                disc,
+                classification,
+                (plan,),
+                config={},
+                which=lambda _name: None,
+            )
+    finally:
+        metadata_json._default_tool_version.cache_clear()
+
+    assert document["tools"] == {"discripper-probe-tool": "discripper-probe-tool 1.0"}
+    assert probed == ["discripper-probe-tool"]
+
+
 def test_write_metadata_document_persists_json(tmp_path: Path) -> None:
     document = {
         "generated_at": datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat(),
@@ -142,6 +187,17 @@ def test_write_metadata_document_persists_json(tmp_path: Path) -> None:
     assert loaded == document
 
 
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+def test_write_metadata_document_respects_umask(tmp_path: Path) -> None:
+    previous = os.umask(0o002)
+    try:
+        path = write_metadata_document({}, tmp_path)
+    finally:
+        os.umask(previous)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o664
+
+
 def test_build_metadata_document_handles_missing_metadata(tmp_path: Path) -> None:
     title = TitleInfo(
         label="Feature",
@@ -1,10 +1,10 @@
-from copy import deepcopy
 from datetime import timedelta
 from pathlib import Path
 
 import pytest
 
 from discripper import config as config_module
+from discripper.core import naming
 from discripper.core import (
     DiscInfo,
     TitleInfo,
@@ -34,6 +34,21 @@ def test_sanitize_component_collapses_repeated_separators() -> None:
     assert sanitized == "odd_name"
 
 
+@pytest.mark.parametrize(
+    ("value", "separator", "expected"),
+    [
+        ("Firefly_Serenity", "_", "Firefly_Serenity"),
+        ("Firefly_Serenity", "-", "Firefly-Serenity"),
+        ("Episode01", "-", "Episode01"),
+        ("_Pilot__Cut_", "_", "Pilot_Cut"),
+    ],
+)
+def test_sanitize_component_handles_already_safe_values(
+    value: str, separator: str, expected: str
+) -> None:
+    assert sanitize_component(value, separator=separator) == expected
+
+
 def test_sanitize_component_returns_fallback_when_empty() -> None:
     sanitized = sanitize_component("@@@@")
     assert sanitized == "untitled"
@@ -130,9 +145,63 @@ def test_series_output_path_adds_suffix_when_collision(tmp_path: Path) -> None:
     assert second == tmp_path / "example-show" / "example-show_track01_1.mp4"
 
 
+def test_movie_output_path_ignores_unrelated_files(tmp_path: Path) -> None:
+    title = TitleInfo(label="The Matrix", duration=timedelta(minutes=136))
+    config = {"output_directory": tmp_path}
+
+    directory = tmp_path / "the-matrix"
+    directory.mkdir()
+    (directory / "the-matrix_track02.mp4").touch()
+    (directory / "the-matrix_track01.mkv").touch()
+
+    path = movie_output_path(title, config)
+    assert path == directory / "the-matrix_track01.mp4"
+
+
+class _FakeScandir:
+    """Stand-in for :func:`os.scandir` that lists nothing or refuses to list."""
+
+    def __init__(self, error: OSError | None) -> None:
+        self._error = error
+
+    def __call__(self, _path: str) -> "_FakeScandir":
+        if self._error is not None:
+            raise self._error
+        return self
+
+    def __enter__(self) -> list[object]:
+        return []
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        pytest.param(PermissionError("listing denied"), id="unlistable-directory"),
+        pytest.param(None, id="listing-misses-collision"),
+    ],
+)
+def test_movie_output_path_probes_when_listing_is_unreliable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, error: OSError | None
+) -> None:
+    title = TitleInfo(label="The Matrix", duration=timedelta(minutes=136))
+    config = {"output_directory": tmp_path}
+
+    directory = tmp_path / "the-matrix"
+    directory.mkdir()
+    (directory / "the-matrix_track01.mp4").touch()
+    monkeypatch.setattr(naming.os, "scandir", _FakeScandir(error))
+
+    path = movie_output_path(title, config)
+
+    assert path == directory / "the-matrix_track01_1.mp4"
+
+
 def test_movie_output_path_honors_custom_patterns(tmp_path: Path) -> None:
     title = TitleInfo(label="The Matrix", duration=timedelta(minutes=136))
-    config = deepcopy(config_module.DEFAULT_CONFIG)
+    config = config_module.clone_default_config()
     config["output_directory"] = str(tmp_path)
     config["naming"]["disc_directory_pattern"] = "custom/{slug}"
     config["naming"]["track_filename_pattern"] = "{slug}-{index:03d}.{ext}"
@@ -179,7 +248,7 @@ def test_movie_output_path_uses_fallback_when_labels_empty(tmp_path: Path) -> No
 
 def test_movie_output_path_raises_for_unknown_pattern_placeholder(tmp_path: Path) -> None:
     title = TitleInfo(label="Feature", duration=timedelta(minutes=110))
-    config = deepcopy(config_module.DEFAULT_CONFIG)
+    config = config_module.clone_default_config()
     config["output_directory"] = str(tmp_path)
     config["naming"]["track_filename_pattern"] = "{slug}_{missing}"
 
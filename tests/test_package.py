@@ -2,25 +2,26 @@
 
 from importlib import metadata
 from pathlib import Path
-import sys
+
+import pytest
 
 import discripper
 from discripper import cli
 from discripper import core
 
+_SRC_DIR = Path(__file__).resolve().parents[1] / "src"
 
-def test_version_is_string() -> None:
-    """The package exposes a version string."""
 
-    assert isinstance(discripper.__version__, str)
-    assert discripper.__version__ != ""
+@pytest.mark.parametrize("module", [discripper, core], ids=["package", "core"])
+def test_version_is_string(module) -> None:
+    """The package and its core subpackage expose a version string."""
 
+    assert isinstance(module.__version__, str)
+    assert module.__version__ != ""
 
-def test_cli_main_errors_without_inspection_tools(tmp_path, monkeypatch, capsys) -> None:
-    """The CLI reports a helpful error when no inspection tools are available."""
 
-    device = tmp_path / "device"
-    device.write_text("ready", encoding="utf-8")
+def test_cli_main_errors_without_inspection_tools(device, monkeypatch, capsys) -> None:
+    """The CLI reports a helpful error when no inspection tools are available."""
 
     monkeypatch.setattr(
         cli,
@@ -35,33 +36,23 @@ def test_cli_main_errors_without_inspection_tools(tmp_path, monkeypatch, capsys)
     assert "No supported inspection tools" in captured.err
 
 
-def test_core_version_is_exposed() -> None:
-    """The core package exposes a placeholder version string."""
-
-    assert isinstance(core.__version__, str)
-    assert core.__version__ != ""
-
-
 def test_pytest_pythonpath_includes_src() -> None:
     """Pytest configuration ensures the source directory is importable."""
 
-    repo_root = Path(__file__).resolve().parents[1]
-    expected_src = repo_root / "src"
-
-    assert expected_src.exists()
-    assert any(Path(path).resolve() == expected_src for path in map(Path, sys.path))
+    # Checking where the package was imported from avoids resolving every
+    # sys.path entry and also catches an installed copy shadowing the tree.
+    assert Path(discripper.__file__).resolve().is_relative_to(_SRC_DIR)
 
 
 def test_console_script_entry_point_registered() -> None:
     """The console script entry point resolves to the CLI main function."""
 
-    entry_points = metadata.entry_points()
-    if hasattr(entry_points, "select"):
-        console_scripts = entry_points.select(group="console_scripts")
-    else:  # pragma: no cover - fallback for older importlib.metadata APIs
-        console_scripts = entry_points.get("console_scripts", [])
+    # Read only this distribution's entry points instead of scanning every
+    # installed distribution.
+    entry_points = metadata.distribution("discripper").entry_points
+    console_scripts = entry_points.select(group="console_scripts", name="discripper")
 
-    discripper_entry = next((ep for ep in console_scripts if ep.name == "discripper"), None)
+    discripper_entry = next(iter(console_scripts), None)
 
     assert discripper_entry is not None
     assert discripper_entry.value == "discripper.cli:main"
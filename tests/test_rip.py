@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 from datetime import timedelta
-import io
-import time
+import re
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
 import pytest
 
@@ -22,43 +21,53 @@ from discripper.core import (
 from discripper.core import rip as rip_module
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def sample_title() -> TitleInfo:
+    # TitleInfo is frozen, so one instance can safely be shared by the module.
     return TitleInfo(label="Main Feature", duration=timedelta(minutes=95))
 
 
+class _LineStream:
+    """Iterable stand-in for a subprocess pipe backed by pre-split lines."""
+
+    def __init__(self, data: str) -> None:
+        self._lines = data.splitlines(keepends=True)
+        self.closed = False
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._lines)
+
+    def close(self) -> None:
+        self.closed = True
+
+
 class FakePopen:
     def __init__(
         self,
         command: tuple[str, ...],
         *,
         stderr_data: str = "",
-        stdout_data: str = "",
+        stdout_data: str | None = None,
         returncode: int = 0,
-        finish_delay: float = 0.0,
+        polls_before_exit: int = 0,
         on_wait: Callable[[], None] | None = None,
     ) -> None:
         self.args = command
         self.returncode = returncode
-        self._stderr = io.StringIO(stderr_data)
-        self._stdout = io.StringIO(stdout_data)
-        self.stderr = self._stderr
-        self.stdout = self._stdout
-        self._start = time.monotonic()
-        self._finish_delay = finish_delay
+        self.stderr = _LineStream(stderr_data)
+        # Only tests that exercise the stdout reader pay for a second pipe.
+        self.stdout = None if stdout_data is None else _LineStream(stdout_data)
+        self._polls_before_exit = polls_before_exit
         self._on_wait = on_wait
 
     def poll(self) -> int | None:
-        if time.monotonic() - self._start >= self._finish_delay:
-            return self.returncode
-        return None
+        if self._polls_before_exit > 0:
+            self._polls_before_exit -= 1
+            return None
+        return self.returncode
 
     def wait(self, timeout: float | None = None) -> int:
-        deadline = None if timeout is None else time.monotonic() + timeout
-        while self.poll() is None:
-            if deadline is not None and time.monotonic() > deadline:
-                raise TimeoutError
-            time.sleep(0.01)
+        self._polls_before_exit = 0
         if self._on_wait is not None:
             callback = self._on_wait
             self._on_wait = None
@@ -67,21 +76,77 @@ class FakePopen:
 
 
 
+_PROGRESS_PATTERN = re.compile(r"\bEVENT=PROGRESS BACKEND=(\w+)")
+_FIELD_PATTERN = re.compile(r"(\w+)=(\S+)")
+
+
+_FFMPEG_PROGRESS_STDERR = "\n".join(
+    [
+        "frame=1",
+        "out_time_ms=1000",
+        "total_size=2048",
+        "speed=1.0x",
+        "progress=continue",
+        "junk",
+        "out_time_ms=5000",
+        "speed=1.5x",
+        "total_size=4096",
+        "progress=end",
+    ]
+) + "\n"
+
+
+def _progress_events(
+    caplog: pytest.LogCaptureFixture, backend: str
+) -> list[dict[str, str]]:
+    """Return the KEY=VALUE fields of each progress log line for *backend*."""
+
+    events = []
+    for record in caplog.records:
+        message = record.getMessage()
+        match = _PROGRESS_PATTERN.search(message)
+        if match is not None and match[1] == backend:
+            events.append(dict(_FIELD_PATTERN.findall(message)))
+    return events
+
+
 def _ffmpeg_only(cmd: str) -> str | None:
     if cmd == "ffmpeg":
         return "/usr/bin/ffmpeg"
     return None
 
 
-def test_rip_title_builds_ffmpeg_plan(tmp_path: Path, sample_title: TitleInfo) -> None:
+@pytest.fixture
+def basic_plan(tmp_path: Path, sample_title: TitleInfo) -> RipPlan:
+    """Return an executable ffmpeg plan writing to ``tmp_path / "out.mp4"``."""
+
+    return rip_title(
+        tmp_path / "device.iso",
+        sample_title,
+        tmp_path / "out.mp4",
+        which=_ffmpeg_only,
+    )
+
+
+@pytest.mark.parametrize(
+    ("path_device", "dry_run"),
+    [
+        pytest.param(False, False, id="string-device-execute"),
+        pytest.param(True, True, id="path-device-dry-run"),
+    ],
+)
+def test_rip_title_builds_ffmpeg_plan(
+    tmp_path: Path, sample_title: TitleInfo, path_device: bool, dry_run: bool
+) -> None:
+    device: str | Path = tmp_path / "device.iso" if path_device else "/dev/sr0"
     destination = tmp_path / "output.mp4"
 
-    plan = rip_title("/dev/sr0", sample_title, destination, which=_ffmpeg_only)
+    plan = rip_title(device, sample_title, destination, dry_run=dry_run, which=_ffmpeg_only)
 
     assert isinstance(plan, RipPlan)
     assert plan.title is sample_title
     assert plan.destination == destination
-    assert plan.device == "/dev/sr0"
+    assert plan.device == str(device)
     assert plan.command[:7] == (
         "ffmpeg",
         "-hide_banner",
@@ -93,20 +158,7 @@ def test_rip_title_builds_ffmpeg_plan(tmp_path: Path, sample_title: TitleInfo) -
     )
     assert "-i" in plan.command
     assert plan.command[-2:] == (plan.device, str(destination))
-    assert plan.will_execute is True
-
-
-def test_rip_title_honors_dry_run_flag(tmp_path: Path, sample_title: TitleInfo) -> None:
-    plan = rip_title(
-        tmp_path / "device.iso",
-        sample_title,
-        tmp_path / "out.mp4",
-        dry_run=True,
-        which=_ffmpeg_only,
-    )
-
-    assert plan.will_execute is False
-    assert plan.device == str(tmp_path / "device.iso")
+    assert plan.will_execute is not dry_run
 
 
 def test_rip_title_prefers_dvdbackup_when_available(
@@ -189,24 +241,40 @@ def test_rip_disc_series_uses_episode_codes(tmp_path: Path) -> None:
     assert all(plan.will_execute is False for plan in plans)
 
 
-def test_run_rip_plan_invokes_subprocess(tmp_path: Path, sample_title: TitleInfo) -> None:
-    plan = rip_title(
-        tmp_path / "device.iso",
-        sample_title,
-        tmp_path / "out.mp4",
-        which=_ffmpeg_only,
+def test_rip_disc_looks_up_each_tool_once(tmp_path: Path) -> None:
+    titles = tuple(
+        TitleInfo(label=f"Episode {index}", duration=timedelta(minutes=45))
+        for index in range(1, 4)
     )
+    classification = ClassificationResult("series", titles)
+    lookups: list[str] = []
+
+    def counting_which(command: str) -> str | None:
+        lookups.append(command)
+        return _ffmpeg_only(command)
 
+    plans = rip_disc(
+        "/dev/sr0",
+        classification,
+        lambda title, _code, index: tmp_path / f"{index:02d}.mp4",
+        which=counting_which,
+    )
+
+    assert len(plans) == 3
+    assert sorted(lookups) == ["dvdbackup", "ffmpeg"]
+
+
+def test_run_rip_plan_invokes_subprocess(basic_plan: RipPlan) -> None:
     calls: list[tuple[tuple[str, ...], dict[str, object]]] = []
 
     def fake_popen(command: tuple[str, ...], **kwargs: object) -> FakePopen:
         calls.append((command, kwargs))
         return FakePopen(command)
 
-    result = run_rip_plan(plan, popen=fake_popen)
+    result = run_rip_plan(basic_plan, popen=fake_popen)
 
     assert calls
-    assert calls[0][0] == plan.command
+    assert calls[0][0] == basic_plan.command
     assert isinstance(result, CompletedProcess)
     assert result.returncode == 0
 
@@ -247,7 +315,7 @@ def test_run_rip_plan_refuses_to_overwrite_existing_file(
         calls.append((command, kwargs))
         return FakePopen(command)
 
-    with caplog.at_level("WARNING"):
+    with caplog.at_level("WARNING", logger=rip_module.logger.name):
         with pytest.raises(RipExecutionError, match="Refusing to overwrite existing file"):
             run_rip_plan(plan, popen=fake_popen)
 
@@ -269,7 +337,8 @@ def test_run_rip_plan_skips_dry_run(
     def fake_popen(command: tuple[str, ...], **kwargs: object) -> FakePopen:
         raise AssertionError("popen should not be called for dry-run plans")
 
-    result = run_rip_plan(plan, popen=fake_popen)
+    with caplog.at_level("INFO", logger=rip_module.logger.name):
+        result = run_rip_plan(plan, popen=fake_popen)
 
     assert result is None
 
@@ -279,61 +348,39 @@ def test_run_rip_plan_skips_dry_run(
     assert any("EVENT=RIP_SKIPPED" in message for message in caplog.messages)
 
 
-def test_run_rip_plan_logs_success(tmp_path: Path, sample_title: TitleInfo, caplog) -> None:
-    plan = rip_title(
-        tmp_path / "device.iso",
-        sample_title,
-        tmp_path / "out.mp4",
-        which=_ffmpeg_only,
-    )
-
+def test_run_rip_plan_logs_success(basic_plan: RipPlan, caplog) -> None:
     def fake_popen(command: tuple[str, ...], **kwargs: object) -> FakePopen:
         return FakePopen(
             command,
-            on_wait=lambda: plan.destination.write_bytes(b"data"),
+            on_wait=lambda: basic_plan.destination.write_bytes(b"data"),
         )
 
-    with caplog.at_level("INFO"):
-        result = run_rip_plan(plan, popen=fake_popen)
+    with caplog.at_level("INFO", logger=rip_module.logger.name):
+        result = run_rip_plan(basic_plan, popen=fake_popen)
 
     assert isinstance(result, CompletedProcess)
-    assert any("EVENT=RIP_DONE" in message for message in caplog.messages)
-    assert any("BYTES=4" in message for message in caplog.messages)
+    done = next((message for message in caplog.messages if "EVENT=RIP_DONE" in message), None)
+    assert done is not None
+    assert "BYTES=4" in done
 
 
-def test_run_rip_plan_maps_called_process_error(
-    tmp_path: Path, sample_title: TitleInfo
-) -> None:
-    plan = rip_title(
-        tmp_path / "device.iso",
-        sample_title,
-        tmp_path / "out.mp4",
-        which=_ffmpeg_only,
-    )
-
+def test_run_rip_plan_maps_called_process_error(basic_plan: RipPlan) -> None:
     def fake_popen(command: tuple[str, ...], **kwargs: object) -> FakePopen:
         return FakePopen(command, returncode=3)
 
     with pytest.raises(RipExecutionError) as excinfo:
-        run_rip_plan(plan, popen=fake_popen)
+        run_rip_plan(basic_plan, popen=fake_popen)
 
     assert excinfo.value.exit_code == 2
     assert "exit code 3" in str(excinfo.value)
 
 
-def test_run_rip_plan_maps_os_error(tmp_path: Path, sample_title: TitleInfo) -> None:
-    plan = rip_title(
-        tmp_path / "device.iso",
-        sample_title,
-        tmp_path / "out.mp4",
-        which=_ffmpeg_only,
-    )
-
+def test_run_rip_plan_maps_os_error(basic_plan: RipPlan) -> None:
     def fake_popen(command: tuple[str, ...], **kwargs: object) -> FakePopen:
         raise OSError(5, "Input/output error")
 
     with pytest.raises(RipExecutionError) as excinfo:
-        run_rip_plan(plan, popen=fake_popen)
+        run_rip_plan(basic_plan, popen=fake_popen)
 
     assert excinfo.value.exit_code == 2
     assert "Input/output error" in str(excinfo.value)
@@ -350,41 +397,22 @@ def test_run_rip_plan_reports_ffmpeg_progress(
         which=_ffmpeg_only,
     )
 
-    stderr_data = "\n".join(
-        [
-            "frame=1",
-            "out_time_ms=1000",
-            "total_size=2048",
-            "speed=1.0x",
-            "progress=continue",
-            "junk",
-            "out_time_ms=5000",
-            "speed=1.5x",
-            "total_size=4096",
-            "progress=end",
-        ]
-    )
-    stderr_data += "\n"
-
     def fake_popen(command: tuple[str, ...], **kwargs: object) -> FakePopen:
         return FakePopen(
             command,
-            stderr_data=stderr_data,
+            stderr_data=_FFMPEG_PROGRESS_STDERR,
+            stdout_data="",
             on_wait=lambda: plan.destination.write_bytes(b"done"),
         )
 
-    with caplog.at_level("INFO"):
+    with caplog.at_level("INFO", logger=rip_module.logger.name):
         run_rip_plan(plan, popen=fake_popen)
 
-    progress_logs = [
-        record.message
-        for record in caplog.records
-        if "EVENT=PROGRESS BACKEND=ffmpeg" in record.message
-    ]
+    percentages = [event["PCT"] for event in _progress_events(caplog, "ffmpeg") if "PCT" in event]
 
-    assert progress_logs, "Expected ffmpeg progress logs"
-    assert any("PCT=" in message and "PCT=100.0" not in message for message in progress_logs)
-    assert any("PCT=100.0" in message for message in progress_logs)
+    assert percentages, "Expected ffmpeg progress logs"
+    assert any(pct != "100.0" for pct in percentages)
+    assert "100.0" in percentages
 
 
 def test_run_rip_plan_reports_dvdbackup_progress(
@@ -403,27 +431,24 @@ def test_run_rip_plan_reports_dvdbackup_progress(
 
     sizes = iter([0, 2048, 4096, 8192])
 
+    monkeypatch.setattr(rip_module, "_OUTPUT_POLL_INTERVAL", 0.001)
     monkeypatch.setattr(rip_module, "_probe_dvd_volume_size", lambda device: 8192)
     monkeypatch.setattr(rip_module, "_directory_size", lambda path: next(sizes, 8192))
 
     def fake_popen(command: tuple[str, ...], **kwargs: object) -> FakePopen:
-        return FakePopen(command, finish_delay=0.05)
+        return FakePopen(command, polls_before_exit=1)
 
-    with caplog.at_level("INFO"):
+    with caplog.at_level("INFO", logger=rip_module.logger.name):
         run_rip_plan(plan, popen=fake_popen)
 
-    progress_logs = [
-        record.message
-        for record in caplog.records
-        if "EVENT=PROGRESS BACKEND=dvdbackup" in record.message
-    ]
+    events = _progress_events(caplog, "dvdbackup")
 
-    assert progress_logs, "Expected dvdbackup progress logs"
-    assert any("BYTES_DONE=2048" in message for message in progress_logs)
-    assert any("PCT=" in message for message in progress_logs)
+    assert events, "Expected dvdbackup progress logs"
+    assert any(event["BYTES_DONE"] == "2048" for event in events)
+    assert any("PCT" in event for event in events)
 
 
-def test_run_rip_plan_reports_dvdbackup_spinner_when_unknown_total(
+def test_dvdbackup_progress_reporter_uses_spinner_when_total_unknown(
     tmp_path: Path,
     sample_title: TitleInfo,
     caplog: pytest.LogCaptureFixture,
@@ -442,20 +467,16 @@ def test_run_rip_plan_reports_dvdbackup_spinner_when_unknown_total(
     monkeypatch.setattr(rip_module, "_probe_dvd_volume_size", lambda device: None)
     monkeypatch.setattr(rip_module, "_directory_size", lambda path: next(sizes, 2048))
 
-    def fake_popen(command: tuple[str, ...], **kwargs: object) -> FakePopen:
-        return FakePopen(command, finish_delay=0.05)
+    reporter = rip_module._create_progress_reporter(plan)
+    assert isinstance(reporter, rip_module._DvdBackupProgressReporter)
 
-    with caplog.at_level("INFO"):
-        run_rip_plan(plan, popen=fake_popen)
+    with caplog.at_level("INFO", logger=rip_module.logger.name):
+        reporter.handle_idle()
+        reporter.finalize(True)
 
-    progress_logs = [
-        record.message
-        for record in caplog.records
-        if "EVENT=PROGRESS BACKEND=dvdbackup" in record.message
-    ]
+    events = _progress_events(caplog, "dvdbackup")
 
-    assert progress_logs, "Expected dvdbackup progress logs"
-    assert any("SPINNER=true" in message for message in progress_logs)
-    assert all(
-        "PCT=" not in message for message in progress_logs if "SPINNER=true" in message
-    )
+    assert events, "Expected dvdbackup progress logs"
+    spinner_events = [event for event in events if event.get("SPINNER") == "true"]
+    assert spinner_events
+    assert all("PCT" not in event for event in spinner_events)
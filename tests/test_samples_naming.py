@@ -1,48 +1,44 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any, Callable
+
+import pytest
 
 from discripper.config import DEFAULT_CONFIG
+from discripper.core import ClassificationResult, DiscInfo
 from discripper.core.classifier import classify_disc, thresholds_from_config
-from discripper.core.fake import inspect_from_fixture
 from discripper.core.naming import movie_output_path, series_output_path
 
+ConfigFactory = Callable[..., dict[str, Any]]
+DestinationBuilder = Callable[[DiscInfo, ClassificationResult, dict[str, Any]], list[Path]]
 
-def _simulation_fixture(name: str) -> Path:
-    return Path(__file__).resolve().parents[1] / "samples" / f"{name}.json"
-
-
-def test_simulated_movie_output_matches_prd_pattern(tmp_path: Path) -> None:
-    config = DEFAULT_CONFIG.copy()
-    output_dir = tmp_path / "Videos"
-    config["output_directory"] = str(output_dir)
-
-    disc = inspect_from_fixture(_simulation_fixture("simulated_movie"))
-    classification = classify_disc(disc, thresholds=thresholds_from_config(config))
-
-    assert classification.disc_type == "movie"
 
-    config["title"] = disc.label
+@pytest.fixture
+def config_factory(tmp_path: Path) -> ConfigFactory:
+    """Return a builder for default configs writing under ``tmp_path / "Videos"``."""
 
-    movie_plan = movie_output_path(classification.episodes[0], config)
-    expected = output_dir / "simulation-feature-film" / "simulation-feature-film_track01.mp4"
-    assert movie_plan == expected
+    def _make(**overrides: Any) -> dict[str, Any]:
+        config = dict(DEFAULT_CONFIG, output_directory=str(tmp_path / "Videos"))
+        config.update(overrides)
+        return config
 
+    return _make
 
-def test_simulated_series_output_matches_prd_pattern(tmp_path: Path) -> None:
-    config = DEFAULT_CONFIG.copy()
-    output_dir = tmp_path / "Videos"
-    config["output_directory"] = str(output_dir)
 
-    disc = inspect_from_fixture(_simulation_fixture("simulated_series"))
-    classification = classify_disc(disc, thresholds=thresholds_from_config(config))
+def _movie_destinations(
+    disc: DiscInfo, classification: ClassificationResult, config: dict[str, Any]
+) -> list[Path]:
+    return [movie_output_path(classification.episodes[0], config)]
 
-    assert classification.disc_type == "series"
-    assert classification.episode_codes is not None
 
-    config["title"] = disc.label
+def _series_destinations(
+    disc: DiscInfo, classification: ClassificationResult, config: dict[str, Any]
+) -> list[Path]:
+    codes = classification.episode_codes
+    assert codes is not None
 
-    destinations = [
+    return [
         series_output_path(
             disc.label,
             title,
@@ -51,15 +47,51 @@ def test_simulated_series_output_matches_prd_pattern(tmp_path: Path) -> None:
             track_index=index,
         )
         for index, (title, code) in enumerate(
-            zip(classification.episodes, classification.episode_codes),
+            zip(classification.episodes, codes),
             start=1,
         )
     ]
 
-    expected_dir = output_dir / "simulation-limited-series"
-    assert destinations == [
-        expected_dir / "simulation-limited-series_track01.mp4",
-        expected_dir / "simulation-limited-series_track02.mp4",
-        expected_dir / "simulation-limited-series_track03.mp4",
-        expected_dir / "simulation-limited-series_track04.mp4",
+
+@pytest.mark.parametrize(
+    ("disc_fixture", "expected_type", "build_destinations", "slug", "track_count"),
+    [
+        pytest.param(
+            "simulated_movie_disc",
+            "movie",
+            _movie_destinations,
+            "simulation-feature-film",
+            1,
+            id="movie",
+        ),
+        pytest.param(
+            "simulated_series_disc",
+            "series",
+            _series_destinations,
+            "simulation-limited-series",
+            4,
+            id="series",
+        ),
+    ],
+)
+def test_simulated_output_matches_prd_pattern(
+    request: pytest.FixtureRequest,
+    tmp_path: Path,
+    config_factory: ConfigFactory,
+    disc_fixture: str,
+    expected_type: str,
+    build_destinations: DestinationBuilder,
+    slug: str,
+    track_count: int,
+) -> None:
+    disc: DiscInfo = request.getfixturevalue(disc_fixture)
+    config = config_factory(title=disc.label)
+
+    classification = classify_disc(disc, thresholds=thresholds_from_config(config))
+
+    assert classification.disc_type == expected_type
+
+    expected_dir = tmp_path / "Videos" / slug
+    assert build_destinations(disc, classification, config) == [
+        expected_dir / f"{slug}_track{index:02d}.mp4" for index in range(1, track_count + 1)
     ]
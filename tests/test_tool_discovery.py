@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
 from typing import Optional
 
+import pytest
+
 from discripper.core import (
     BLURAY_INSPECTOR_CANDIDATES,
     InspectionTools,
@@ -59,5 +63,29 @@ def test_discover_inspection_tools_handles_missing_commands() -> None:
     assert discovered == InspectionTools(dvd=None, fallback=None, blu_ray=None)
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Windows resolves executables via PATHEXT")
+def test_discover_inspection_tools_skips_non_executable_matches(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (first / "lsdvd").write_text("", encoding="utf-8")
+    for name in ("lsdvd", "bd_info"):
+        executable = second / name
+        executable.write_text("", encoding="utf-8")
+        executable.chmod(0o755)
+
+    monkeypatch.setenv("PATH", os.pathsep.join([str(first), str(second)]))
+    discovered = discover_inspection_tools()
+
+    assert discovered == InspectionTools(
+        dvd=ToolAvailability("lsdvd", str(second / "lsdvd")),
+        fallback=None,
+        blu_ray=ToolAvailability("bd_info", str(second / "bd_info")),
+    )
+
+
 def test_blu_ray_candidate_list_is_not_empty() -> None:
     assert BLURAY_INSPECTOR_CANDIDATES